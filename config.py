@@ -54,6 +54,7 @@ PLUGIN_CONFIG_SCHEMA = {
         "total_timeout_sec": ConfigField(type=float, default=0.0, description="TTS 总超时(秒)，<=0 表示不限制"),
         "conn_limit": ConfigField(type=int, default=32, description="TTS HTTP 连接池上限"),
         "stream_chunk_size": ConfigField(type=int, default=8192, description="TTS 流式读取块大小(字节)"),
+        "segment_concurrency": ConfigField(type=int, default=1, description="同一轮回复内并发合成的分句数，>1 时后续分句提前合成并按序下发；1 为串行"),
         # CosyVoice HTTP fastapi runtime 参数 (type=cosyvoice_http 时生效)
         "cosyvoice_mode": ConfigField(type=str, default="cross_lingual", description="CosyVoice 模式: 'cross_lingual' 或 'zero_shot'"),
         "cosyvoice_ref_audio_path": ConfigField(type=str, default="", description="CosyVoice 参考音频路径(prompt_wav)"),
@@ -1,5 +1,7 @@
+import functools
 import json
 import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterable
 
 from fastapi import HTTPException
@@ -340,16 +342,26 @@ def collect_config_asset_ids(config: dict[str, Any]) -> set[str]:
     return asset_ids
 
 
-async def ensure_assets_exist(db: AsyncSession, asset_ids: Iterable[str]) -> None:
+async def ensure_assets_exist(db: AsyncSession, asset_ids: Iterable[str]) -> dict[str, Asset]:
+    """Validate that all asset ids exist; returns the loaded rows keyed by asset_id."""
     wanted = {x.strip() for x in asset_ids if isinstance(x, str) and x.strip()}
     if not wanted:
-        return
+        return {}
     stmt = select(Asset).where(Asset.asset_id.in_(wanted))
     rows = (await db.execute(stmt)).scalars().all()
-    existing = {row.asset_id for row in rows}
-    missing = sorted(wanted - existing)
+    assets_by_id = {row.asset_id: row for row in rows}
+    missing = sorted(wanted - assets_by_id.keys())
     if missing:
         raise HTTPException(status_code=400, detail=f"asset not found: {missing[0]}")
+    return assets_by_id
+
+
+def touch_updated_at(row: AvatarCharacter) -> None:
+    """Set updated_at client-side so the row can be serialized after commit without a refresh.
+
+    Naive UTC matches what SQLite's CURRENT_TIMESTAMP stores for the server default.
+    """
+    row.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 def _parse_legacy_mapping(mapping_json: str | None) -> dict[str, str | None]:
@@ -381,6 +393,12 @@ async def _load_or_create_runtime(db: AsyncSession) -> AvatarRuntime:
     return runtime
 
 
+async def get_active_character_id(db: AsyncSession) -> str | None:
+    """Read the runtime's active pointer without repairing or committing anything."""
+    stmt = select(AvatarRuntime.active_character_id).where(AvatarRuntime.runtime_id == RUNTIME_ID)
+    return (await db.execute(stmt)).scalars().first()
+
+
 async def _load_legacy_full_map(db: AsyncSession) -> dict[str, str | None]:
     row = (await db.execute(select(AvatarMap).where(AvatarMap.map_id == LEGACY_MAP_ID))).scalars().first()
     if not row:
@@ -398,9 +416,8 @@ async def upsert_legacy_avatar_map_from_full_map(db: AsyncSession, full_map: dic
     row.mapping_json = json.dumps(payload, ensure_ascii=False)
 
 
-def _safe_json_to_config(text: str | None) -> dict[str, Any]:
-    if not isinstance(text, str):
-        return default_character_config()
+@functools.lru_cache(maxsize=256)
+def _parse_config_cached(text: str) -> dict[str, Any]:
     try:
         data = json.loads(text)
     except Exception:
@@ -411,6 +428,19 @@ def _safe_json_to_config(text: str | None) -> dict[str, Any]:
         return default_character_config()
 
 
+def _safe_json_to_config(text: str | None) -> dict[str, Any]:
+    if not isinstance(text, str):
+        return default_character_config()
+    # The stored JSON text is the cache key: any update writes a new string.
+    # Callers get a shallow copy and must replace top-level keys rather than
+    # mutate nested values shared with the cache.
+    return dict(_parse_config_cached(text))
+
+
+def load_character_config(character: AvatarCharacter) -> dict[str, Any]:
+    return _safe_json_to_config(character.config_json)
+
+
 async def ensure_active_character(db: AsyncSession) -> tuple[AvatarRuntime, AvatarCharacter]:
     runtime = await _load_or_create_runtime(db)
 
@@ -444,12 +474,15 @@ async def ensure_active_character(db: AsyncSession) -> tuple[AvatarRuntime, Avat
     return runtime, active_char
 
 
-async def resolve_assets(db: AsyncSession, config: dict[str, Any]) -> dict[str, Any]:
-    asset_ids = collect_config_asset_ids(config)
-    assets_by_id: dict[str, Asset] = {}
-    if asset_ids:
-        rows = (await db.execute(select(Asset).where(Asset.asset_id.in_(asset_ids)))).scalars().all()
-        assets_by_id = {row.asset_id: row for row in rows}
+async def resolve_assets(
+    db: AsyncSession, config: dict[str, Any], assets_by_id: dict[str, Asset] | None = None
+) -> dict[str, Any]:
+    if assets_by_id is None:
+        asset_ids = collect_config_asset_ids(config)
+        assets_by_id = {}
+        if asset_ids:
+            rows = (await db.execute(select(Asset).where(Asset.asset_id.in_(asset_ids)))).scalars().all()
+            assets_by_id = {row.asset_id: row for row in rows}
 
     full_map_resolved: dict[str, dict[str, Any] | None] = {}
     full_map = config.get("fullMap", {})
@@ -491,7 +524,12 @@ async def resolve_assets(db: AsyncSession, config: dict[str, Any]) -> dict[str,
     return {"fullMap": full_map_resolved, "parts": parts_resolved}
 
 
-async def serialize_character(db: AsyncSession, character: AvatarCharacter, include_resolved: bool = False) -> dict[str, Any]:
+async def serialize_character(
+    db: AsyncSession,
+    character: AvatarCharacter,
+    include_resolved: bool = False,
+    assets_by_id: dict[str, Asset] | None = None,
+) -> dict[str, Any]:
     config = _safe_json_to_config(character.config_json)
     payload: dict[str, Any] = {
         "character_id": character.character_id,
@@ -504,5 +542,5 @@ async def serialize_character(db: AsyncSession, character: AvatarCharacter, incl
         "updated_at": character.updated_at.isoformat() if character.updated_at else None,
     }
     if include_resolved:
-        payload["resolved"] = await resolve_assets(db, config)
+        payload["resolved"] = await resolve_assets(db, config, assets_by_id=assets_by_id)
     return payload
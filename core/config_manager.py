@@ -8,6 +8,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 import tomlkit
 
 from ..config import PLUGIN_CONFIG_SCHEMA
@@ -26,6 +27,7 @@ class ConfigManager:
         self.config_path = self.plugin_dir / "config.toml"
         self.backup_dir = self.plugin_dir / "config_backups"
         self._apply_lock = asyncio.Lock()
+        self._schema_json: bytes | None = None
 
     @property
     def apply_lock(self) -> asyncio.Lock:
@@ -148,6 +150,13 @@ class ConfigManager:
         asr = cfg.get("asr", {})
         sherpa = cfg.get("sherpa", {})
 
+        server = cfg.get("server", {})
+        if not str(server.get("host", "") or "").strip():
+            self._add_issue(errors, "REQUIRED", "server.host", "必须填写 server.host")
+        port = server.get("port")
+        if not isinstance(port, int) or not (1 <= port <= 65535):
+            self._add_issue(errors, "INVALID_VALUE", "server.port", "server.port 必须为 1-65535 之间的整数")
+
         tts_type = str(tts.get("type", "")).strip()
         tts_url = str(tts.get("api_url", "")).strip()
 
@@ -365,6 +374,12 @@ class ConfigManager:
         shutil.copy2(p, self.config_path)
         return True
 
+    def build_schema_json(self) -> bytes:
+        """Serialized build_schema(); the schema only depends on code, so it is built once."""
+        if self._schema_json is None:
+            self._schema_json = orjson.dumps(self.build_schema())
+        return self._schema_json
+
     def build_schema(self) -> dict[str, Any]:
         sections: dict[str, Any] = {}
         for section, fields in PLUGIN_CONFIG_SCHEMA.items():
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger("call_me_ws")
+
+Job = Callable[[], Awaitable[Any]]
+
+
+class JobWorker:
+    """
+    常驻单 task 顺序执行 job，避免每轮对话/预思考都 create_task。
+    - submit(): 只保留最新一个待执行 job（旧的未开始 job 被丢弃，记 debug 日志）
+    - cancel(): 丢弃待执行 job 并打断当前 job；worker 本身继续服务后续 job
+    - close(): 会话结束时真正停止 worker
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+
+    @property
+    def busy(self) -> bool:
+        return self._running or not self._queue.empty()
+
+    def submit(self, job: Job) -> bool:
+        if self._closed:
+            return False
+        if self._drop_pending():
+            logger.debug("[Worker] %s dropped a queued job that had not started", self._name)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self._name)
+        self._queue.put_nowait(job)
+        self._idle.clear()
+        return True
+
+    def cancel(self):
+        self._drop_pending()
+        if self._running:
+            # 已有一次取消在途时不再叠加，否则 cancelling() 计数会残留在常驻 task 上 (3.11+)
+            cancelling = getattr(self._task, "cancelling", None)
+            if cancelling is None or not cancelling():
+                self._task.cancel()
+        else:
+            self._idle.set()
+
+    async def wait_idle(self, timeout: float = 0.5):
+        if self._idle.is_set():
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            # Timeout is acceptable during forced interruption.
+            pass
+
+    async def close(self, timeout: float = 0.5):
+        self._closed = True
+        self._drop_pending()
+        task = self._task
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await asyncio.wait_for(task, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+    def _drop_pending(self) -> bool:
+        dropped = False
+        while True:
+            try:
+                self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return dropped
+            dropped = True
+
+    async def _run(self):
+        current = asyncio.current_task()
+        while True:
+            try:
+                job = await self._queue.get()
+                self._running = True
+                await job()
+            except asyncio.CancelledError:
+                if self._closed:
+                    raise
+                # 仅打断了当前 job：把取消计数清零 (3.11+)，worker 继续运行
+                uncancel = getattr(current, "uncancel", None)
+                if uncancel is not None:
+                    while uncancel() > 0:
+                        pass
+            except Exception as e:
+                logger.warning("[Worker] %s job failed: %s", self._name, e, exc_info=True)
+            finally:
+                self._running = False
+                if self._queue.empty():
+                    self._idle.set()
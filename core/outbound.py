@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+import orjson
+from fastapi import WebSocket
+
+logger = logging.getLogger("call_me_ws")
+
+_CLOSE = object()
+
+
+class RawJson(bytes):
+    """已序列化好的 JSON 消息：按普通消息发送（可并入 batch），不会再 dumps"""
+
+
+def _dumps(obj: "dict[str, Any] | RawJson") -> bytes:
+    if type(obj) is RawJson:
+        return obj
+    # Compact UTF-8 JSON, same wire format as Starlette's send_json (ensure_ascii=False).
+    return orjson.dumps(obj)
+
+
+class OutboundCoalescer:
+    """
+    每个会话唯一的下行写入器：所有服务端消息经同一队列按序发送。
+    客户端在 client.hello 中声明 "batch" 能力后，发送期间排队的多条消息
+    会合并为一帧 {"type": "batch", "items": [...]}，减少 WebSocket 帧数。
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_batch_bytes: int = 256 * 1024,
+        max_delay_ms: float = 5.0,
+        max_pending: int = 64,
+    ):
+        self._websocket = websocket
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._max_batch_bytes = max_batch_bytes
+        self._max_delay_s = max(0.0, max_delay_ms / 1000.0)
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self._carry: tuple | None = None
+        self.batching = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _ensure_writer(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="call_me_outbound")
+
+    async def send(self, obj: "dict[str, Any] | RawJson", flush: bool = False) -> bool:
+        """
+        Queue one message. Returns False if the writer has already failed/closed.
+        flush=True ends the current batch right after this message (state changes, final audio).
+        """
+        if self._closed:
+            return False
+        self._ensure_writer()
+        await self._queue.put((obj, flush))
+        return True
+
+    async def send_binary(self, data: bytes, flush: bool = False) -> bool:
+        """Queue one binary frame; ordered with JSON messages but never batched."""
+        if self._closed:
+            return False
+        if type(data) is not bytes:
+            data = bytes(data)
+        self._ensure_writer()
+        await self._queue.put((data, flush))
+        return True
+
+    async def close(self, timeout: float = 0.5):
+        if self._task is None:
+            self._closed = True
+            return
+        if not self._closed:
+            self._closed = True
+            try:
+                self._queue.put_nowait(_CLOSE)
+            except asyncio.QueueFull:
+                self._task.cancel()
+        try:
+            await asyncio.wait_for(self._task, timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        except Exception:
+            pass
+
+    async def _write(self, texts: list[bytes]):
+        # 前端按文本帧解析 JSON，故仍以 text 帧发送
+        if len(texts) == 1:
+            await self._websocket.send_text(texts[0].decode("utf-8"))
+        else:
+            frame = b'{"type":"batch","items":[' + b",".join(texts) + b"]}"
+            await self._websocket.send_text(frame.decode("utf-8"))
+
+    async def _collect(self, first_text: bytes, flush: bool) -> tuple[list[bytes], bool]:
+        """Gather queued messages into one batch. Returns (texts, stop_after_write)."""
+        texts = [first_text]
+        size = len(first_text)
+        deadline = time.monotonic() + self._max_delay_s
+        while not flush and size < self._max_batch_bytes:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is _CLOSE:
+                return texts, True
+            obj, flush = item
+            if type(obj) is bytes:
+                # 二进制帧不能并入 batch，留到本批写出之后
+                self._carry = item
+                break
+            text = _dumps(obj)
+            texts.append(text)
+            size += len(text)
+        return texts, False
+
+    async def _run(self):
+        try:
+            while True:
+                if self._carry is not None:
+                    item, self._carry = self._carry, None
+                else:
+                    item = await self._queue.get()
+                if item is _CLOSE:
+                    return
+                obj, flush = item
+                if type(obj) is bytes:
+                    await self._websocket.send_bytes(obj)
+                    continue
+                text = _dumps(obj)
+                if not self.batching:
+                    await self._websocket.send_text(text.decode("utf-8"))
+                    continue
+                texts, stop = await self._collect(text, flush)
+                await self._write(texts)
+                if stop:
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("[WS] Outbound writer stopped: %s", e)
+        finally:
+            self._closed = True
+            # Unblock producers waiting on a full queue; their messages are dropped.
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
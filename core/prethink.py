@@ -1,3 +1,4 @@
+import functools
 import re
 
 _MEANINGFUL_RE = re.compile(r"[A-Za-z0-9\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7a3]")
@@ -56,6 +57,19 @@ def sanitize_prethink_result(raw_text: str, max_chars: int) -> str:
     return cleaned
 
 
+def prethink_result_settled(raw_text: str, max_chars: int) -> bool:
+    """
+    True if more streamed text can no longer change sanitize_prethink_result():
+    the complete lines so far (fences closed) already give 3 lines or max_chars.
+    """
+    head, sep, _ = str(raw_text or "").rpartition("\n")
+    if not sep or head.count("```") % 2:
+        return False
+    cleaned = sanitize_prethink_result(head, max_chars=max_chars)
+    return cleaned.count("\n") >= 2 or len(cleaned) >= max(60, int(max_chars))
+
+
+@functools.lru_cache(maxsize=256)
 def build_prethink_injection_block(hint_text: str) -> str:
     hint = str(hint_text or "").strip()
     if not hint:
@@ -1,6 +1,8 @@
-from src.config.config import global_config
+import functools
 import random
 
+from src.config.config import global_config
+
 def build_system_prompt() -> str:
     """
     Build the system prompt based on the global configuration (Personalty, Bot Name, etc.)
@@ -25,15 +27,6 @@ def build_system_prompt() -> str:
     ):
         personality = random.choice(personality_config.states)
 
-    # 构建 Prompt
-    system_prompt = f"你的名字是{bot_name}。"
-    
-    if bot_config.alias_names:
-        aliases = ",".join(bot_config.alias_names)
-        system_prompt += f"也有人叫你{aliases}。"
-    
-    system_prompt += f"\n你{personality}"
-    
     # 回复风格 (Reply Style)
     reply_style = personality_config.reply_style
     # 处理多种回复风格 (Multiple Reply Styles)
@@ -43,13 +36,34 @@ def build_system_prompt() -> str:
         and random.random() < personality_config.multiple_probability
     ):
         reply_style = random.choice(personality_config.multiple_reply_style)
+
+    return _render_system_prompt(
+        bot_name,
+        tuple(bot_config.alias_names or ()),
+        personality,
+        reply_style,
+        personality_config.plan_style,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _render_system_prompt(bot_name, alias_names: tuple, personality, reply_style, plan_style) -> str:
+    """随机选择之后的纯拼接部分，按输入缓存（配置热更新后参数变化会自然失效）"""
+    # 构建 Prompt
+    system_prompt = f"你的名字是{bot_name}。"
+    
+    if alias_names:
+        aliases = ",".join(alias_names)
+        system_prompt += f"也有人叫你{aliases}。"
+    
+    system_prompt += f"\n你{personality}"
         
     if reply_style:
         system_prompt += f"\n你的说话风格是：{reply_style}"
 
     # 说话规则/行为风格 (Plan Style)
-    if personality_config.plan_style:
-         system_prompt += f"\n行为准则：{personality_config.plan_style}"
+    if plan_style:
+         system_prompt += f"\n行为准则：{plan_style}"
          
     system_prompt += "\n请用简短的口语回答，适合语音合成。"
     system_prompt += "\n【输出格式硬性要求】"
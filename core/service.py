@@ -1,3 +1,4 @@
+import asyncio
 import threading
 import uvicorn
 import time
@@ -6,6 +7,15 @@ from src.common.logger import get_logger
 
 logger = get_logger("call_me_service")
 
+
+def _new_server_loop() -> asyncio.AbstractEventLoop:
+    """服务线程专用事件循环：装了 uvloop 就用它，否则回退标准 asyncio（如 Windows）"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
 class CallMeService:
     _instance = None
     _lock = threading.Lock()
@@ -23,6 +33,8 @@ class CallMeService:
         
         self._server_thread: Optional[threading.Thread] = None
         self._server_instance: Optional[uvicorn.Server] = None
+        # Server that was asked to exit; kept so callers can wait for its listener to close.
+        self._stopping_server: Optional[uvicorn.Server] = None
         self._is_running = False
         self._host = "127.0.0.1"
         self._port = 8989
@@ -60,6 +72,7 @@ class CallMeService:
         
         if self._server_instance:
             self._server_instance.should_exit = True
+            self._stopping_server = self._server_instance
             # 等待线程结束? 由于是 daemon 线程，且 shutdown 也是为了 graceful exit
             # 这里我们简单标记停止
         
@@ -67,6 +80,35 @@ class CallMeService:
         self._server_instance = None
         logger.info("[CallMe] 服务停止指令已下达")
 
+    def _listener_closed(self) -> bool:
+        server = self._stopping_server
+        if server is None:
+            return True
+        # uvicorn closes its listening sockets at the start of shutdown, before it
+        # drains in-flight requests (which may include the caller's own request).
+        return not any(s.is_serving() for s in getattr(server, "servers", []))
+
+    def _is_started(self) -> bool:
+        server = self._server_instance
+        return server is not None and bool(server.started)
+
+    @staticmethod
+    async def _wait_until(predicate, timeout: float, interval: float = 0.02) -> bool:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+        return True
+
+    async def wait_until_stopped(self, timeout: float = 2.0) -> bool:
+        """等待已停止的服务释放监听端口（最多 timeout 秒）"""
+        return await self._wait_until(self._listener_closed, timeout)
+
+    async def wait_until_started(self, timeout: float = 2.0) -> bool:
+        """等待新服务完成启动并开始监听（最多 timeout 秒）"""
+        return await self._wait_until(lambda: self._is_started() or not self._is_running, timeout) and self._is_started()
+
     def get_status(self) -> str:
         if self._is_running:
             return f"运行中 (http://{self._host}:{self._port})"
@@ -81,15 +123,29 @@ class CallMeService:
             log_level="info",
             loop="asyncio"
         )
-        self._server_instance = uvicorn.Server(config)
+        server = uvicorn.Server(config)
+        self._server_instance = server
         
         logger.info(f"[CallMe Uvicorn] Starting on {host}:{port}")
+        # 不用 server.run()/uvloop.install()：它们会改进程级 event loop policy，影响宿主
+        loop = _new_server_loop()
+        asyncio.set_event_loop(loop)
         try:
-            self._server_instance.run()
+            loop.run_until_complete(server.serve())
         except Exception as e:
             logger.error(f"[CallMe Uvicorn] Error: {e}")
         finally:
-            self._is_running = False
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                pass
+            asyncio.set_event_loop(None)
+            loop.close()
+            # A restarted service may already own a newer thread; only reset state for our own.
+            if self._server_thread is threading.current_thread():
+                self._is_running = False
+            if self._stopping_server is server:
+                self._stopping_server = None
             logger.info("[CallMe Uvicorn] Stopped.")
 
 # Global instance
@@ -5,6 +5,8 @@ from typing import Dict, Optional
 from fastapi import WebSocket
 from dataclasses import dataclass, field
 
+from .job_worker import Job, JobWorker
+from .outbound import OutboundCoalescer
 from .state_machine import StateMachine, CallState
 from ..utils.metrics import MetricsCollector
 
@@ -15,6 +17,10 @@ class SessionContext:
     websocket: WebSocket
     state: StateMachine = field(default_factory=StateMachine)
     metrics: MetricsCollector = field(default_factory=MetricsCollector)
+    # 下行消息写入器 (按序发送，可选合并为 batch 帧)
+    outbound: OutboundCoalescer = field(init=False)
+    # 客户端声明 binary_audio 能力后，TTS 音频以二进制帧下发
+    binary_audio: bool = False
 
     # 核心并发锁
     # speaking_lock: 确保在说话时不会处理新的TTS任务(除非被打断)
@@ -37,8 +43,10 @@ class SessionContext:
 
     # Streaming ASR incremental text cache (UI feedback)
     _last_partial_text: str = ""
-    _tracked_tasks: set[asyncio.Task] = field(default_factory=set)
-    _prethink_task: Optional[asyncio.Task] = None
+    _turn_seq: int = 0
+    # 常驻 worker: 对话轮次 / 预思考各一个，取消只打断当前 job
+    _turn_worker: JobWorker = field(init=False)
+    _prethink_worker: JobWorker = field(init=False)
     _prethink_job_id: int = 0
     _prethink_hint: str = ""
     _prethink_hint_ready_at: float = 0.0
@@ -46,6 +54,9 @@ class SessionContext:
 
     def __post_init__(self):
         self.metrics.metrics["session_id"] = self.session_id
+        self.outbound = OutboundCoalescer(self.websocket)
+        self._turn_worker = JobWorker(f"call_me_turn_{self.session_id}")
+        self._prethink_worker = JobWorker(f"call_me_prethink_{self.session_id}")
 
     def create_cancel_token(self):
         """重置取消信号"""
@@ -55,7 +66,7 @@ class SessionContext:
         """触发取消信号"""
         self._cancel_event.set()
         self.metrics.increment("interrupt_count")
-        self.cancel_tracked_tasks()
+        self.cancel_turn()
         self.cancel_prethink_task()
 
     @property
@@ -71,45 +82,35 @@ class SessionContext:
             if overflow > 0:
                 del self.chat_history[:overflow]
 
-    def track_task(self, task: asyncio.Task):
-        self._tracked_tasks.add(task)
+    def submit_turn(self, job: Job) -> bool:
+        """
+        Queue a turn on the session's turn worker.
+        A queued turn that has not started yet is replaced (dropped) by this one.
+        """
+        return self._turn_worker.submit(job)
 
-        def _done_cb(done_task: asyncio.Task):
-            self._tracked_tasks.discard(done_task)
+    def turn_busy(self) -> bool:
+        """Whether a turn is running or queued on the turn worker."""
+        return self._turn_worker.busy
 
-        task.add_done_callback(_done_cb)
-
-    def has_tracked_tasks(self) -> bool:
-        return any(not task.done() for task in self._tracked_tasks)
-
-    def cancel_tracked_tasks(self):
-        for task in tuple(self._tracked_tasks):
-            if not task.done():
-                task.cancel()
+    def cancel_turn(self):
+        """Drop any queued turn and interrupt the running one."""
+        self._turn_worker.cancel()
 
     def create_prethink_job(self) -> int:
         """Create a new prethink generation job id and invalidate older results."""
         self._prethink_job_id += 1
         return self._prethink_job_id
 
-    def set_prethink_task(self, task: asyncio.Task, job_id: int):
-        """Register current prethink task. Older task (if any) is cancelled."""
+    def submit_prethink(self, job: Job, job_id: int) -> bool:
+        """Run a prethink job. Older job (if any) is cancelled."""
         self.cancel_prethink_task()
         self._prethink_job_id = max(self._prethink_job_id, int(job_id))
-        self._prethink_task = task
-
-        def _done_cb(done_task: asyncio.Task):
-            if self._prethink_task is done_task:
-                self._prethink_task = None
-
-        task.add_done_callback(_done_cb)
+        return self._prethink_worker.submit(job)
 
     def cancel_prethink_task(self):
-        """Cancel in-flight prethink task only (does not clear cached hint)."""
-        task = self._prethink_task
-        if task and not task.done():
-            task.cancel()
-        self._prethink_task = None
+        """Cancel in-flight prethink job only (does not clear cached hint)."""
+        self._prethink_worker.cancel()
 
     def store_prethink_hint(self, job_id: int, hint: str, source_turn_id: int) -> bool:
         """Store prethink result iff this task is still the latest job."""
@@ -137,15 +138,13 @@ class SessionContext:
         self._prethink_hint_from_turn = 0
         return hint, age_ms, source_turn_id
 
-    async def wait_tracked_tasks(self, timeout: float = 0.5):
-        tasks = [task for task in self._tracked_tasks if not task.done()]
-        if not tasks:
-            return
-        try:
-            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=timeout)
-        except asyncio.TimeoutError:
-            # Timeout is acceptable during forced interruption.
-            pass
+    async def close_workers(self, timeout: float = 0.5):
+        await self._turn_worker.close(timeout=timeout)
+        await self._prethink_worker.close(timeout=timeout)
+
+    async def wait_turn_idle(self, timeout: float = 0.5):
+        """Wait (bounded) for the turn worker to finish its current turn."""
+        await self._turn_worker.wait_idle(timeout=timeout)
 
 
 class SessionManager:
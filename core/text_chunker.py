@@ -1,5 +1,5 @@
 import re
-from typing import Generator, List, Tuple
+from typing import Callable, Generator, List, Tuple
 
 class TextChunker:
     """
@@ -11,6 +11,9 @@ class TextChunker:
     STRONG_DELIMITERS = r"[。！？!?\n~～…—]+"
     # 弱切分符号 (长度够了才切)
     WEAK_DELIMITERS = r"[，,；;：:]+"
+    _STRONG_CHARS = frozenset("。！？!?\n~～…—")
+    # 任一切分符（单字符匹配，强/弱由 _STRONG_CHARS 区分）
+    _DELIMITER_RE = re.compile(r"[。！？!?\n~～…—，,；;：:]")
     
     def __init__(self, min_chunk_size: int = 10, max_chunk_size: int = 50):
         self.min_chunk_size = min_chunk_size
@@ -27,36 +30,70 @@ class TextChunker:
         处理流入的文本，生成 (seq, text, is_final)
         is_final: 是否是根据强逻辑切分的完整句子 (影响前端显示或停顿)
         """
-        for char in text_stream:
-            self.buffer += char
-            
+        # 普通字符只会累加进缓冲区：用正则一次跳到下一个分隔符（或长度上限处），
+        # 只在这些位置做判断，不再逐字符走 Python 循环。
+        end = len(text_stream)
+        if len(self.buffer) + end < self.max_chunk_size and not self._DELIMITER_RE.search(text_stream):
+            # 最常见的情况: 小 token 里没有分隔符，直接累加
+            self.buffer += text_stream
+            return
+        pos = 0
+        while pos < end:
+            # 缓冲区达到 max_chunk_size 的那个字符下标（已超长时为下一个字符）
+            limit = pos + max(self.max_chunk_size - len(self.buffer), 1) - 1
+            m = self._DELIMITER_RE.search(text_stream, pos, min(limit + 1, end))
+            if m is None:
+                if limit >= end:
+                    self.buffer += text_stream[pos:]
+                    return
+                # 检查长度限制 (强制切分)
+                self.buffer += text_stream[pos : limit + 1]
+                pos = limit + 1
+                yield self.seq_id, self.buffer.strip(), False
+                self.seq_id += 1
+                self.buffer = ""
+                continue
+
+            idx = m.start()
+            self.buffer += text_stream[pos : idx + 1]
+            pos = idx + 1
+
             # 检查强切分
-            if re.search(self.STRONG_DELIMITERS, char):
+            if text_stream[idx] in self._STRONG_CHARS:
                 if self.buffer.strip():
                     yield self.seq_id, self.buffer.strip(), True
                     self.seq_id += 1
                     self.buffer = ""
                 continue
-            
-            # 检查长度限制 (强制切分)
-            if len(self.buffer) >= self.max_chunk_size:
-                 # 尝试在之前的弱切分点切断（如果有）
-                 # 这里简化处理：直接切分，实际可以优选最近的标点
+
+            # 弱切分符: 先看长度上限，再看是否够长
+            if len(self.buffer) >= self.max_chunk_size or len(self.buffer) > self.min_chunk_size:
                 yield self.seq_id, self.buffer.strip(), False
                 self.seq_id += 1
                 self.buffer = ""
-                continue
 
-            # 检查弱切分
-            if re.search(self.WEAK_DELIMITERS, char):
-                if len(self.buffer) > self.min_chunk_size:
-                    yield self.seq_id, self.buffer.strip(), False
-                    self.seq_id += 1
-                    self.buffer = ""
-    
     def flush(self) -> Generator[Tuple[int, str, bool], None, None]:
         """刷新剩余缓冲区"""
         if self.buffer.strip():
             yield self.seq_id, self.buffer.strip(), True
             self.seq_id += 1
         self.buffer = ""
+
+    def process_sanitized(
+        self, text_stream: str, sanitize: Callable[[str], str]
+    ) -> Generator[Tuple[int, str, bool], None, None]:
+        """
+        同 process()，但在切分的同一遍中对每个片段调用 sanitize，
+        sanitize 返回空串的片段直接跳过（seq 照常递增）。
+        """
+        for seq_id, chunk, is_final in self.process(text_stream):
+            cleaned = sanitize(chunk)
+            if cleaned:
+                yield seq_id, cleaned, is_final
+
+    def flush_sanitized(self, sanitize: Callable[[str], str]) -> Generator[Tuple[int, str, bool], None, None]:
+        """同 flush()，输出经 sanitize 过滤"""
+        for seq_id, chunk, is_final in self.flush():
+            cleaned = sanitize(chunk)
+            if cleaned:
+                yield seq_id, cleaned, is_final
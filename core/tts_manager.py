@@ -3,6 +3,7 @@ import copy
 import json
 import logging
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import AsyncGenerator, Dict, Optional
 
@@ -24,6 +25,10 @@ from .volc_tts_protocol import (
 
 logger = logging.getLogger("call_me_tts")
 
+# 非流式 synthesize() 结果缓存：只缓存短句（开场白/口头禅类高频重复），LRU 淘汰
+_SYNTH_CACHE_MAX_ENTRIES = 200
+_SYNTH_CACHE_MAX_TEXT_CHARS = 80
+
 
 class TTSManager:
     """
@@ -40,6 +45,8 @@ class TTSManager:
         self._active_gpt_weights: Optional[str] = None
         self._active_sovits_weights: Optional[str] = None
         self._sovits_set_weights_supported: Optional[bool] = None
+        # (text, voice_id) -> wav bytes
+        self._synth_cache: "OrderedDict[tuple[str, str], bytes]" = OrderedDict()
 
     @staticmethod
     def _as_bool(value, default: bool = False) -> bool:
@@ -86,6 +93,11 @@ class TTSManager:
         self.conn_limit = max(4, int(config.get("conn_limit", 32)))
         self._config_error: Optional[str] = None
         self._sovits_set_weights_supported = None
+        # 每个新连接都会调用 configure：仅当 TTS 配置实际变化（音色/参考音频/后端等）时才作废旧的合成结果
+        fingerprint = json.dumps(config, sort_keys=True, default=str)
+        if fingerprint != getattr(self, "_config_fingerprint", None):
+            self._config_fingerprint = fingerprint
+            self._synth_cache.clear()
         if prev_api_url.rstrip("/") != str(self.api_url).rstrip("/"):
             self._active_gpt_weights = None
             self._active_sovits_weights = None
@@ -471,8 +483,25 @@ class TTSManager:
     
     async def synthesize(self, text: str, voice_id: str = None, provider_id: str = "default") -> Optional[bytes]:
         """
-        合成语音
+        合成语音（短句结果按 (text, voice_id) 缓存）
         """
+        key = (text.strip(), str(voice_id))
+        if len(key[0]) > _SYNTH_CACHE_MAX_TEXT_CHARS:
+            return await self._synthesize_uncached(text, voice_id, provider_id)
+        wav = self._synth_cache.get(key)
+        if wav is not None:
+            self._synth_cache.move_to_end(key)
+            return wav
+        wav = await self._synthesize_uncached(text, voice_id, provider_id)
+        if wav:
+            self._synth_cache[key] = wav
+            if len(self._synth_cache) > _SYNTH_CACHE_MAX_ENTRIES:
+                self._synth_cache.popitem(last=False)
+        return wav
+
+    async def _synthesize_uncached(
+        self, text: str, voice_id: str = None, provider_id: str = "default"
+    ) -> Optional[bytes]:
         if not hasattr(self, "type"):
             self.configure({"type": "mock"})
 
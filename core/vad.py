@@ -33,6 +33,8 @@ class VADManager:
             self.webrtc_aggressiveness = 3
 
         self._webrtc_vad = None
+        # WebRTC VAD 支持的帧长 -> 每帧字节数 (PCM16)，只算一次
+        self._frame_bytes = {ms: self.frame_bytes(ms) for ms in (10, 20, 30)}
         if self.mode == VADMode.WEBRTC.value:
             try:
                 import webrtcvad
@@ -51,6 +53,10 @@ class VADManager:
         # 假设每帧 20ms or 30ms，根据实际 audio chunk 大小决定
         # 这里仅作逻辑状态维护，具体的 audio processing 在外部循环调用 process
         
+    def frame_bytes(self, chunk_duration_ms: int) -> int:
+        """PCM16 单声道下 chunk_duration_ms 对应的字节数"""
+        return int(self.sample_rate * (chunk_duration_ms / 1000.0) * 2)
+
     def reset(self):
         self.is_speech_active = False
         self.speech_duration_ms = 0
@@ -69,13 +75,15 @@ class VADManager:
 
     def _webrtc_process(self, audio_chunk: bytes, chunk_duration_ms: int) -> bool:
         # WebRTC VAD 仅支持 10/20/30ms 帧。
-        if chunk_duration_ms not in (10, 20, 30):
+        expected_len = self._frame_bytes.get(chunk_duration_ms)
+        if expected_len is None:
             return self._energy_vad(audio_chunk, self.energy_threshold)
 
-        expected_len = int(self.sample_rate * (chunk_duration_ms / 1000.0) * 2)
-        if len(audio_chunk) < expected_len:
+        chunk_len = len(audio_chunk)
+        if chunk_len < expected_len:
             return self._energy_vad(audio_chunk, self.energy_threshold)
-        frame = audio_chunk[:expected_len]
+        # 常见情况帧长正好匹配，无需切片拷贝
+        frame = audio_chunk if chunk_len == expected_len else audio_chunk[:expected_len]
 
         try:
             return bool(self._webrtc_vad.is_speech(frame, self.sample_rate))
@@ -7,10 +7,17 @@ import {
   transcriptAtom,
   wsUrlAtom,
 } from '@/state/call'
-import { base64ToBytes, bytesToBase64, downsampleFloat32, float32ToPcm16 } from '@/lib/audio'
+import { base64ToBytes, downsampleFloat32, float32ToPcm16 } from '@/lib/audio'
 import type { Emotion } from '@/types/avatar'
 export type { Emotion } from '@/types/avatar'
 
+// 告知服务端本客户端支持的可选协议特性
+const CLIENT_CAPABILITIES = ['batch', 'binary_audio']
+
+// binary_audio 帧: tag(u8) + seq(u32 LE) + sample_rate(u32 LE) + WAV bytes
+const TTS_AUDIO_FRAME_TAG = 0x01
+const TTS_AUDIO_FRAME_HEADER_SIZE = 9
+
 export type MicMode = 'hands_free' | 'push_to_talk'
 
 export type DialogueTurn = {
@@ -379,23 +386,16 @@ export function useCallSessionController() {
     setConn((c) => ({ ...c, status: 'connecting' }))
 
     const ws = new WebSocket(wsUrl)
+    ws.binaryType = 'arraybuffer'
     wsRef.current = ws
 
     ws.onopen = () => {
       setConn((c) => ({ ...c, status: 'connected' }))
       appendLog(`WS open: ${wsUrl}`)
-      ws.send(JSON.stringify({ type: 'client.hello' }))
+      ws.send(JSON.stringify({ type: 'client.hello', data: { capabilities: CLIENT_CAPABILITIES } }))
     }
 
-    ws.onmessage = (evt) => {
-      let msg: unknown
-      try {
-        msg = JSON.parse(String(evt.data)) as unknown
-      } catch {
-        appendLog('WS message (non-JSON) ignored')
-        return
-      }
-
+    const handleMessage = (msg: unknown) => {
       const type = getMessageType(msg)
       if (!type) {
         appendLog('WS message: unknown')
@@ -496,6 +496,10 @@ export function useCallSessionController() {
         return
       }
 
+      if (type === 'tts.audio_meta') {
+        return
+      }
+
       if (type === 'tts.text_stream') {
         if (isRecord(msg) && isRecord(msg.data)) {
           const t = getString(msg.data.text)
@@ -522,6 +526,38 @@ export function useCallSessionController() {
       }
     }
 
+    const handleBinaryFrame = (buf: ArrayBuffer) => {
+      if (buf.byteLength <= TTS_AUDIO_FRAME_HEADER_SIZE) return
+      const view = new DataView(buf)
+      if (view.getUint8(0) !== TTS_AUDIO_FRAME_TAG) {
+        appendLog(`WS binary frame: unknown tag ${view.getUint8(0)}`)
+        return
+      }
+      const seq = view.getUint32(1, true)
+      flushPendingTtsTextForSeq(seq)
+      enqueueAndPlay(new Uint8Array(buf, TTS_AUDIO_FRAME_HEADER_SIZE))
+    }
+
+    ws.onmessage = (evt) => {
+      if (evt.data instanceof ArrayBuffer) {
+        handleBinaryFrame(evt.data)
+        return
+      }
+      let msg: unknown
+      try {
+        msg = JSON.parse(String(evt.data)) as unknown
+      } catch {
+        appendLog('WS message (non-JSON) ignored')
+        return
+      }
+      // 服务端在声明 batch 能力后可能把多条消息合并为一帧
+      if (getMessageType(msg) === 'batch' && isRecord(msg) && Array.isArray(msg.items)) {
+        for (const item of msg.items) handleMessage(item)
+        return
+      }
+      handleMessage(msg)
+    }
+
     ws.onclose = () => {
       appendLog('WS closed')
       wsRef.current = null
@@ -595,8 +631,8 @@ export function useCallSessionController() {
       while (merged.length - offset >= chunkSamples) {
         const slice = merged.subarray(offset, offset + chunkSamples)
         const pcm16 = float32ToPcm16(slice)
-        const b64 = bytesToBase64(new Uint8Array(pcm16.buffer))
-        ws.send(JSON.stringify({ type: 'input.audio_chunk', data: { chunk: b64 } }))
+        // 二进制帧即一块 PCM16，等价于 input.audio_chunk 且免 base64
+        ws.send(pcm16.buffer)
         offset += chunkSamples
       }
 
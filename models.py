@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -27,7 +27,8 @@ class PresetRule(Base):
     __tablename__ = "preset_rules"
 
     rule_id = Column(String, primary_key=True, index=True)
-    preset_id = Column(String, index=True)
+    # SQLite 未开启 foreign_keys，级联不生效：删除预设时由 delete_preset 显式批量删除规则
+    preset_id = Column(String, ForeignKey("presets.preset_id", ondelete="CASCADE"), index=True)
     priority = Column(Integer, default=100) # 越小越优先
     mode = Column(String, default="full") # "full"|"layers"
     match_json = Column(Text, default="{}") # state/emotion/content/intensity区间等
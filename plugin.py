@@ -22,6 +22,7 @@ class CallMePlugin(BasePlugin):
         "aiosqlite",
         "aiohttp",
         "python-multipart",
+        "orjson",
     ]
     config_file_name = "config.toml"
     config_schema = PLUGIN_CONFIG_SCHEMA
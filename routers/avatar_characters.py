@@ -1,8 +1,9 @@
 import json
-import uuid
+import secrets
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,15 +15,18 @@ from ..core.avatar_characters import (
     default_character_config,
     ensure_active_character,
     ensure_assets_exist,
+    get_active_character_id,
+    load_character_config,
     normalize_character_config,
     serialize_character,
+    touch_updated_at,
     upsert_legacy_avatar_map_from_full_map,
 )
 from ..database import get_db_session
 from ..models import AvatarCharacter
 
 
-router = APIRouter(prefix="/api/avatar-characters", tags=["avatar-characters"])
+router = APIRouter(prefix="/api/avatar-characters", tags=["avatar-characters"], default_response_class=ORJSONResponse)
 
 
 class CreateCharacterRequest(BaseModel):
@@ -32,13 +36,28 @@ class CreateCharacterRequest(BaseModel):
 
 
 class UpdateCharacterConfigRequest(BaseModel):
-    config: dict[str, Any]
+    # normalize_character_config does the real validation.
+    config: dict
 
 
 class SetActiveCharacterRequest(BaseModel):
     character_id: str
 
 
+def _serialize_character_row(row: AvatarCharacter) -> dict[str, Any]:
+    created_at = row.created_at
+    updated_at = row.updated_at
+    return {
+        "character_id": row.character_id,
+        "owner_id": row.owner_id,
+        "name": row.name,
+        "renderer_kind": row.renderer_kind,
+        "schema_version": row.schema_version,
+        "created_at": created_at.isoformat() if created_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    }
+
+
 @router.get("/")
 async def list_characters(db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
     runtime, _ = await ensure_active_character(db)
@@ -47,18 +66,7 @@ async def list_characters(db: AsyncSession = Depends(get_db_session)) -> dict[st
     ).scalars().all()
     return {
         "active_character_id": runtime.active_character_id,
-        "items": [
-            {
-                "character_id": row.character_id,
-                "owner_id": row.owner_id,
-                "name": row.name,
-                "renderer_kind": row.renderer_kind,
-                "schema_version": row.schema_version,
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "updated_at": row.updated_at.isoformat() if row.updated_at else None,
-            }
-            for row in rows
-        ],
+        "items": [_serialize_character_row(row) for row in rows],
     }
 
 
@@ -67,15 +75,12 @@ async def create_character(req: CreateCharacterRequest, db: AsyncSession = Depen
     runtime, active_char = await ensure_active_character(db)
 
     if req.seed_from_legacy:
-        try:
-            config = normalize_character_config(json.loads(active_char.config_json))
-        except Exception:
-            config = default_character_config()
+        config = load_character_config(active_char)
     else:
         config = default_character_config()
 
     character = AvatarCharacter(
-        character_id=uuid.uuid4().hex,
+        character_id=secrets.token_hex(16),
         owner_id="",
         name=(req.name or "New Character").strip() or "New Character",
         renderer_kind=(req.renderer_kind or RENDERER_KIND).strip() or RENDERER_KIND,
@@ -111,21 +116,14 @@ async def put_active_character(req: SetActiveCharacterRequest, db: AsyncSession
     if not row:
         raise HTTPException(status_code=404, detail="Character not found")
     runtime.active_character_id = row.character_id
-    config = default_character_config()
-    try:
-        config = normalize_character_config(json.loads(row.config_json))
-    except Exception:
-        pass
+    config = load_character_config(row)
     await upsert_legacy_avatar_map_from_full_map(db, config.get("fullMap", {}))
     await db.commit()
-    await db.refresh(runtime)
-    await db.refresh(row)
     return {"active_character_id": runtime.active_character_id, "character": await serialize_character(db, row, include_resolved=True)}
 
 
 @router.get("/{character_id}")
 async def get_character(character_id: str, db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
-    await ensure_active_character(db)
     row = (await db.execute(select(AvatarCharacter).where(AvatarCharacter.character_id == character_id))).scalars().first()
     if not row:
         raise HTTPException(status_code=404, detail="Character not found")
@@ -146,22 +144,21 @@ async def put_character_config(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    await ensure_assets_exist(db, collect_config_asset_ids(normalized))
+    assets_by_id = await ensure_assets_exist(db, collect_config_asset_ids(normalized))
     row.config_json = json.dumps(normalized, ensure_ascii=False)
     row.schema_version = SCHEMA_VERSION
+    touch_updated_at(row)
 
     if runtime.active_character_id == row.character_id:
         await upsert_legacy_avatar_map_from_full_map(db, normalized.get("fullMap", {}))
 
     await db.commit()
-    await db.refresh(row)
-    return await serialize_character(db, row, include_resolved=True)
+    return await serialize_character(db, row, include_resolved=True, assets_by_id=assets_by_id)
 
 
 @router.delete("/{character_id}")
 async def delete_character(character_id: str, db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
-    runtime, _ = await ensure_active_character(db)
-    if runtime.active_character_id == character_id:
+    if await get_active_character_id(db) == character_id:
         raise HTTPException(status_code=400, detail="Cannot delete active character")
     row = (await db.execute(select(AvatarCharacter).where(AvatarCharacter.character_id == character_id))).scalars().first()
     if not row:
@@ -2,16 +2,17 @@ import json
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.avatar_characters import (
     collect_config_asset_ids,
-    default_character_config,
     ensure_active_character,
     ensure_assets_exist,
-    normalize_character_config,
+    load_character_config,
+    touch_updated_at,
     upsert_legacy_avatar_map_from_full_map,
 )
 from ..core.emotion import EMOTION_TYPES, normalize_emotion
@@ -19,11 +20,13 @@ from ..database import get_db_session
 from ..models import Asset, AvatarCharacter
 
 
-router = APIRouter(prefix="/api/avatar-map", tags=["avatar-map"])
+router = APIRouter(prefix="/api/avatar-map", tags=["avatar-map"], default_response_class=ORJSONResponse)
 
 
 class AvatarMapUpsertRequest(BaseModel):
-    mapping: Dict[str, str]
+    # Bare dict: keys and values are checked in put_active_avatar_map, which
+    # has to normalize emotions anyway.
+    mapping: dict
 
 
 class AvatarMapBindRequest(BaseModel):
@@ -31,31 +34,31 @@ class AvatarMapBindRequest(BaseModel):
     asset_id: str
 
 
-def _safe_load_config(character: AvatarCharacter) -> dict[str, Any]:
-    try:
-        return normalize_character_config(json.loads(character.config_json))
-    except Exception:
-        return default_character_config()
-
-
 def _normalize_full_map(value: dict[str, Any]) -> dict[str, str | None]:
-    out: dict[str, str | None] = {emo: None for emo in EMOTION_TYPES}
-    for emo in EMOTION_TYPES:
-        raw = value.get(emo) if isinstance(value, dict) else None
-        out[emo] = raw.strip() if isinstance(raw, str) and raw.strip() else None
-    return out
+    if not isinstance(value, dict):
+        value = {}
+    get = value.get
+    return {
+        emo: stripped if isinstance(raw := get(emo), str) and (stripped := raw.strip()) else None
+        for emo in EMOTION_TYPES
+    }
 
 
 async def _serialize_legacy_map(
-    db: AsyncSession, character: AvatarCharacter, full_map: dict[str, str | None]
+    db: AsyncSession,
+    character: AvatarCharacter,
+    full_map: dict[str, str | None],
+    assets_by_id: Dict[str, Asset] | None = None,
 ) -> dict[str, Any]:
     mapping = _normalize_full_map(full_map)
 
-    assets_by_id: Dict[str, Asset] = {}
-    asset_ids = [v for v in mapping.values() if isinstance(v, str) and v.strip()]
-    if asset_ids:
-        rows = (await db.execute(select(Asset).where(Asset.asset_id.in_(asset_ids)))).scalars().all()
-        assets_by_id = {a.asset_id: a for a in rows}
+    # Callers that already validated the assets pass the loaded rows to skip a second SELECT.
+    if assets_by_id is None:
+        assets_by_id = {}
+        asset_ids = [v for v in mapping.values() if isinstance(v, str) and v.strip()]
+        if asset_ids:
+            rows = (await db.execute(select(Asset).where(Asset.asset_id.in_(asset_ids)))).scalars().all()
+            assets_by_id = {a.asset_id: a for a in rows}
 
     data: Dict[str, Any] = {}
     for emo in EMOTION_TYPES:
@@ -85,7 +88,7 @@ async def _serialize_legacy_map(
 @router.get("/active")
 async def get_active_avatar_map(db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
     _, character = await ensure_active_character(db)
-    config = _safe_load_config(character)
+    config = load_character_config(character)
     return await _serialize_legacy_map(db, character, config.get("fullMap", {}))
 
 
@@ -95,29 +98,31 @@ async def put_active_avatar_map(
     db: AsyncSession = Depends(get_db_session),
 ) -> dict[str, Any]:
     _, character = await ensure_active_character(db)
-    config = _safe_load_config(character)
+    config = load_character_config(character)
 
     incoming: Dict[str, str] = {}
     for k, v in req.mapping.items():
-        emo = normalize_emotion(k, default="")
+        emo = normalize_emotion(k, default="") if isinstance(k, str) else ""
         if emo not in EMOTION_TYPES:
             continue
-        asset_id = str(v).strip()
+        if not isinstance(v, str):
+            raise HTTPException(status_code=400, detail=f"invalid asset_id for emotion: {k}")
+        asset_id = v.strip()
         if asset_id:
             incoming[emo] = asset_id
 
-    await ensure_assets_exist(db, incoming.values())
     next_full_map: dict[str, str | None] = {emo: None for emo in EMOTION_TYPES}
     for emo, asset_id in incoming.items():
         next_full_map[emo] = asset_id
     config["fullMap"] = next_full_map
 
-    await ensure_assets_exist(db, collect_config_asset_ids(config))
+    # fullMap now holds every incoming asset id, so one lookup covers both checks.
+    assets_by_id = await ensure_assets_exist(db, collect_config_asset_ids(config))
     character.config_json = json.dumps(config, ensure_ascii=False)
+    touch_updated_at(character)
     await upsert_legacy_avatar_map_from_full_map(db, next_full_map)
     await db.commit()
-    await db.refresh(character)
-    return await _serialize_legacy_map(db, character, next_full_map)
+    return await _serialize_legacy_map(db, character, next_full_map, assets_by_id=assets_by_id)
 
 
 @router.put("/bind")
@@ -129,19 +134,18 @@ async def bind_avatar_map(
     if emo not in EMOTION_TYPES:
         raise HTTPException(status_code=400, detail=f"invalid emotion: {req.emotion}")
 
-    await ensure_assets_exist(db, [req.asset_id])
     _, character = await ensure_active_character(db)
-    config = _safe_load_config(character)
+    config = load_character_config(character)
     full_map = _normalize_full_map(config.get("fullMap", {}))
     full_map[emo] = req.asset_id
     config["fullMap"] = full_map
 
-    await ensure_assets_exist(db, collect_config_asset_ids(config))
+    assets_by_id = await ensure_assets_exist(db, collect_config_asset_ids(config))
     character.config_json = json.dumps(config, ensure_ascii=False)
+    touch_updated_at(character)
     await upsert_legacy_avatar_map_from_full_map(db, full_map)
     await db.commit()
-    await db.refresh(character)
-    return await _serialize_legacy_map(db, character, full_map)
+    return await _serialize_legacy_map(db, character, full_map, assets_by_id=assets_by_id)
 
 
 @router.delete("/bind/{emotion}")
@@ -154,13 +158,13 @@ async def unbind_avatar_map(
         raise HTTPException(status_code=400, detail=f"invalid emotion: {emotion}")
 
     _, character = await ensure_active_character(db)
-    config = _safe_load_config(character)
+    config = load_character_config(character)
     full_map = _normalize_full_map(config.get("fullMap", {}))
     full_map[emo] = None
     config["fullMap"] = full_map
 
     character.config_json = json.dumps(config, ensure_ascii=False)
+    touch_updated_at(character)
     await upsert_legacy_avatar_map_from_full_map(db, full_map)
     await db.commit()
-    await db.refresh(character)
     return await _serialize_legacy_map(db, character, full_map)
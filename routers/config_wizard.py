@@ -1,7 +1,7 @@
-import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +11,9 @@ from ..core.tts_manager import tts_manager
 from ..database import get_db_session
 
 
-router = APIRouter(prefix="/api/config", tags=["config"])
+_RESTART_WAIT_TIMEOUT_SEC = 2.0
+
+router = APIRouter(prefix="/api/config", tags=["config"], default_response_class=ORJSONResponse)
 
 
 class ConfigPayload(BaseModel):
@@ -19,6 +21,7 @@ class ConfigPayload(BaseModel):
 
 
 async def _apply_runtime_config(request: Request, cfg: dict[str, Any]) -> dict[str, Any]:
+    # server.host/port are type-checked and range-checked by config_manager.validate_config.
     server_cfg = cfg.get("server", {}) if isinstance(cfg, dict) else {}
     host = str(server_cfg.get("host", "127.0.0.1"))
     port = int(server_cfg.get("port", 8989))
@@ -30,20 +33,24 @@ async def _apply_runtime_config(request: Request, cfg: dict[str, Any]) -> dict[s
     enabled = bool(plugin_cfg.get("enabled", True)) if isinstance(plugin_cfg, dict) else True
 
     restarted = False
+    started_ok = True
     if getattr(call_me_service, "_is_running", False):
         call_me_service.stop()
-        await asyncio.sleep(0.8)
+        # Wait for the old listener to release the port instead of sleeping a fixed time.
+        await call_me_service.wait_until_stopped(timeout=_RESTART_WAIT_TIMEOUT_SEC)
         if enabled:
             call_me_service.start(request.app)
             restarted = True
+            started_ok = await call_me_service.wait_until_started(timeout=_RESTART_WAIT_TIMEOUT_SEC)
     else:
         # Standalone uvicorn path: runtime config can still be applied without owning lifecycle.
         if enabled:
             restarted = False
 
-    await asyncio.sleep(0.2)
     status = call_me_service.get_status()
-    health_ok = True if not enabled else ("运行中" in status or not getattr(call_me_service, "_is_running", False))
+    health_ok = True if not enabled else (
+        started_ok and ("运行中" in status or not getattr(call_me_service, "_is_running", False))
+    )
     return {
         "restarted": restarted,
         "health_ok": health_ok,
@@ -52,9 +59,9 @@ async def _apply_runtime_config(request: Request, cfg: dict[str, Any]) -> dict[s
 
 
 @router.get("/asr-tts/schema")
-async def get_asr_tts_schema(db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
+async def get_asr_tts_schema(db: AsyncSession = Depends(get_db_session)) -> Response:
     del db
-    return config_manager.build_schema()
+    return Response(content=config_manager.build_schema_json(), media_type="application/json")
 
 
 @router.get("/asr-tts/current")
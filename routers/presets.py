@@ -1,7 +1,8 @@
-import uuid
+import secrets
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,7 +11,7 @@ from ..database import get_db_session
 from ..models import Preset, PresetRule
 
 
-router = APIRouter(prefix="/api/presets", tags=["presets"])
+router = APIRouter(prefix="/api/presets", tags=["presets"], default_response_class=ORJSONResponse)
 
 
 class CreatePresetRequest(BaseModel):
@@ -30,20 +31,22 @@ class CreateRuleRequest(BaseModel):
     payload_json: str
 
 
+def _serialize_preset(preset: Preset) -> dict[str, Any]:
+    created_at = preset.created_at
+    return {
+        "preset_id": preset.preset_id,
+        "owner_id": preset.owner_id,
+        "name": preset.name,
+        "default_mode": preset.default_mode,
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
+
 @router.get("/")
 async def list_presets(db: AsyncSession = Depends(get_db_session)) -> list[dict[str, Any]]:
     stmt = select(Preset).order_by(Preset.created_at.asc(), Preset.preset_id.asc())
     rows = (await db.execute(stmt)).scalars().all()
-    return [
-        {
-            "preset_id": p.preset_id,
-            "owner_id": p.owner_id,
-            "name": p.name,
-            "default_mode": p.default_mode,
-            "created_at": p.created_at.isoformat() if p.created_at else None,
-        }
-        for p in rows
-    ]
+    return [_serialize_preset(p) for p in rows]
 
 
 @router.post("/")
@@ -51,7 +54,7 @@ async def create_preset(
     req: CreatePresetRequest,
     db: AsyncSession = Depends(get_db_session),
 ) -> dict[str, Any]:
-    preset_id = uuid.uuid4().hex
+    preset_id = secrets.token_hex(16)
     preset = Preset(
         preset_id=preset_id,
         owner_id="",
@@ -69,13 +72,7 @@ async def get_preset(preset_id: str, db: AsyncSession = Depends(get_db_session))
     preset = (await db.execute(stmt)).scalars().first()
     if not preset:
         raise HTTPException(status_code=404, detail="Preset not found")
-    return {
-        "preset_id": preset.preset_id,
-        "owner_id": preset.owner_id,
-        "name": preset.name,
-        "default_mode": preset.default_mode,
-        "created_at": preset.created_at.isoformat() if preset.created_at else None,
-    }
+    return _serialize_preset(preset)
 
 
 @router.patch("/{preset_id}")
@@ -95,7 +92,6 @@ async def patch_preset(
         preset.default_mode = req.default_mode
 
     await db.commit()
-    await db.refresh(preset)
     return {
         "preset_id": preset.preset_id,
         "name": preset.name,
@@ -115,7 +111,7 @@ async def add_rule(
     if not preset:
         raise HTTPException(status_code=404, detail="Preset not found")
 
-    rule_id = uuid.uuid4().hex
+    rule_id = secrets.token_hex(16)
     rule = PresetRule(
         rule_id=rule_id,
         preset_id=preset_id,
@@ -131,13 +127,12 @@ async def add_rule(
 
 @router.delete("/{preset_id}")
 async def delete_preset(preset_id: str, db: AsyncSession = Depends(get_db_session)) -> dict[str, Any]:
-    stmt = select(Preset).where(Preset.preset_id == preset_id)
-    preset = (await db.execute(stmt)).scalars().first()
-    if not preset:
+    # Bulk statements only: no SELECT of the preset or its rules.
+    result = await db.execute(delete(Preset).where(Preset.preset_id == preset_id))
+    if not result.rowcount:
         raise HTTPException(status_code=404, detail="Preset not found")
 
-    # Delete associated rules first.
+    # SQLite does not enforce the FK cascade, so remove associated rules explicitly.
     await db.execute(delete(PresetRule).where(PresetRule.preset_id == preset_id))
-    await db.delete(preset)
     await db.commit()
     return {"status": "ok"}
@@ -0,0 +1,77 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+# core/job_worker.py 无包内依赖，按文件加载，免去插件包路径配置
+_spec = importlib.util.spec_from_file_location(
+    "call_me_job_worker", Path(__file__).resolve().parents[1] / "core" / "job_worker.py"
+)
+_job_worker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_job_worker)
+JobWorker = _job_worker.JobWorker
+
+
+def test_double_cancel_leaves_worker_clean():
+    async def scenario():
+        worker = JobWorker("test_worker")
+        started = asyncio.Event()
+        interrupted = []
+        results = []
+
+        async def blocking_job():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                interrupted.append(True)
+                raise
+
+        async def next_job():
+            # 若取消计数残留，这里的 await 也会被打断或 cancelling() 非零
+            await asyncio.sleep(0.01)
+            results.append(asyncio.current_task().cancelling())
+
+        worker.submit(blocking_job)
+        await started.wait()
+        # 在 job 处理第一次取消之前连续取消两次 (例如 barge-in + 新轮次的取消路径)
+        worker.cancel()
+        worker.cancel()
+        await worker.wait_idle(timeout=1.0)
+
+        worker.submit(next_job)
+        await worker.wait_idle(timeout=1.0)
+        await worker.close()
+        return interrupted, results
+
+    interrupted, results = asyncio.run(scenario())
+    assert interrupted == [True]
+    assert results == [0]
+
+
+def test_uncancel_clears_stacked_cancel_requests():
+    async def scenario():
+        worker = JobWorker("test_worker_stacked")
+        started = asyncio.Event()
+        results = []
+
+        async def blocking_job():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def next_job():
+            await asyncio.sleep(0.01)
+            results.append(asyncio.current_task().cancelling())
+
+        worker.submit(blocking_job)
+        await started.wait()
+        # 绕过 cancel() 的保护直接叠加两次取消，验证 _run 会把计数清零
+        worker._task.cancel()
+        worker._task.cancel()
+        await worker.wait_idle(timeout=1.0)
+
+        worker.submit(next_job)
+        await worker.wait_idle(timeout=1.0)
+        await worker.close()
+        return results
+
+    assert asyncio.run(scenario()) == [0]
@@ -1,28 +1,121 @@
 import base64
-import io
+import binascii
+import struct
+from typing import NamedTuple
+
+# RIFF/WAVE header for PCM16: RIFF size, fmt chunk (16 bytes), data chunk size.
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_HEADER_SIZE = _WAV_HEADER.size  # 44
+# 不足 44 字节时只解析到 sample_rate (RIFF, size, WAVE, fmt 前半)
+_WAV_HEADER_PREFIX = struct.Struct("<4sI4s12xI")
+
+
+class WavHeader(NamedTuple):
+    riff_size: int
+    sample_rate: int | None
+    data_size: int | None
+
+    @property
+    def header_only(self) -> bool:
+        """GPT-SoVITS 流式首帧: 只有 44 字节头、没有数据"""
+        return self.riff_size == 36 and self.data_size == 0
+
+
+def parse_wav_header(payload) -> WavHeader | None:
+    """
+    一次 unpack 解析 RIFF/WAVE 头；不是 WAV 返回 None。
+    sample_rate 需要至少 28 字节，data_size 需要完整 44 字节，不足时为 None。
+    """
+    size = len(payload)
+    if size >= WAV_HEADER_SIZE:
+        fields = _WAV_HEADER.unpack_from(payload)
+        riff, riff_size, wave, sample_rate, data_size = fields[0], fields[1], fields[2], fields[7], fields[12]
+    elif size >= _WAV_HEADER_PREFIX.size:
+        riff, riff_size, wave, sample_rate = _WAV_HEADER_PREFIX.unpack_from(payload)
+        data_size = None
+    elif size >= 12:
+        riff, riff_size, wave = struct.unpack_from("<4sI4s", payload)
+        sample_rate = data_size = None
+    else:
+        return None
+    if riff != b"RIFF" or wave != b"WAVE":
+        return None
+    return WavHeader(riff_size, sample_rate or None, data_size)
 
-# 尝试导入 soundfile 或 wave 用于处理 WAV
-# 这里仅实现基础转换逻辑
 
 def pcm16_to_wav_bytes(pcm_data: bytes, sample_rate: int = 24000, channels: int = 1) -> bytes:
     """
     将 PCM16 裸数据封装为 WAV 格式
     """
-    import wave
-    
-    with io.BytesIO() as wav_buffer:
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(2) # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_data)
-        
-        return wav_buffer.getvalue()
-
-def encode_wav_to_b64(wav_bytes: bytes) -> str:
-    """Base64 编码"""
-    return base64.b64encode(wav_bytes).decode("utf-8")
+    data_size = len(pcm_data)
+    block_align = channels * 2  # 16-bit
+    header = _WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+    return header + pcm_data
+
+def encode_wav_to_b64(wav_bytes: bytes) -> bytes:
+    """Base64 编码（返回 ASCII bytes，仅在需要 str 的发送边界再 decode）"""
+    return base64.b64encode(wav_bytes)
 
 def decode_b64_to_bytes(b64_str: str) -> bytes:
-    """Base64 解码"""
-    return base64.b64decode(b64_str)
+    """Base64 解码（非严格模式，与 base64.b64decode 默认行为一致）"""
+    return binascii.a2b_base64(b64_str)
+
+
+class PcmRingBuffer:
+    """
+    固定容量的字节环形缓冲：只保留最近 capacity 字节的 PCM，写入时原地拷贝，
+    不为每帧保留独立 bytes 对象。capacity 取偶数，保证丢弃的是整样本。
+    """
+
+    def __init__(self, capacity: int):
+        self._buf = bytearray(max(2, capacity + (capacity & 1)))
+        self._pos = 0  # 下一次写入位置
+        self._size = 0  # 有效字节数
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, data: bytes):
+        n = len(data)
+        cap = len(self._buf)
+        if n >= cap:
+            self._buf[:] = memoryview(data)[n - cap :]
+            self._pos = 0
+            self._size = cap
+            return
+        end = self._pos + n
+        if end <= cap:
+            self._buf[self._pos : end] = data
+        else:
+            first = cap - self._pos
+            view = memoryview(data)
+            self._buf[self._pos :] = view[:first]
+            self._buf[: n - first] = view[first:]
+        self._pos = end % cap
+        self._size = min(cap, self._size + n)
+
+    def getvalue(self) -> bytes:
+        """按时间顺序返回缓冲内容（一次拼接）"""
+        if self._size < len(self._buf):
+            # 尚未回绕：有效数据就是 [pos - size, pos)
+            return bytes(self._buf[self._pos - self._size : self._pos])
+        view = memoryview(self._buf)
+        return b"".join((view[self._pos :], view[: self._pos]))
+
+    def clear(self):
+        self._pos = 0
+        self._size = 0
@@ -1,3 +1,4 @@
+import array
 import time
 from typing import Dict, Any
 
@@ -10,33 +11,37 @@ class MetricsCollector:
             "session_id": "",
             "ttfb_ms": 0,    # Time to First Byte (LLM)
             "ttfa_ms": 0,    # Time to First Audio (TTS)
-            "u_asr_ms": [],  # User ASR latencies
-            "u_tts_ms": [],  # TTS generation latencies
+            "u_asr_ms": array.array("I"),  # User ASR latencies (compact uint32)
+            "u_tts_ms": array.array("I"),  # TTS generation latencies (compact uint32)
             "interrupt_count": 0,
             "session_duration_s": 0.0,
-            "start_time": time.time()
+            "start_time": time.time()  # wall clock, reported as-is
         }
-        self._action_start_times = {}
+        # Durations use the monotonic integer clock.
+        self._start_ns = time.perf_counter_ns()
+        self._action_start_times: Dict[str, int] = {}
 
     def start_measure(self, key: str):
-        self._action_start_times[key] = time.time()
+        self._action_start_times[key] = time.perf_counter_ns()
 
     def end_measure(self, key: str, metric_name: str):
-        if key in self._action_start_times:
-            duration_ms = (time.time() - self._action_start_times[key]) * 1000
-            if isinstance(self.metrics.get(metric_name), list):
-                self.metrics[metric_name].append(int(duration_ms))
-            else:
-                self.metrics[metric_name] = int(duration_ms)
-            del self._action_start_times[key]
+        start_ns = self._action_start_times.pop(key, None)
+        if start_ns is None:
+            return
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+        if isinstance(self.metrics.get(metric_name), (list, array.array)):
+            self.metrics[metric_name].append(duration_ms)
+        else:
+            self.metrics[metric_name] = duration_ms
 
     def record(self, key: str, value: Any):
         self.metrics[key] = value
-    
+
     def increment(self, key: str):
         if key in self.metrics:
             self.metrics[key] += 1
 
     def finalize(self) -> Dict[str, Any]:
-        self.metrics["session_duration_s"] = round(time.time() - self.metrics["start_time"], 2)
-        return self.metrics
+        self.metrics["session_duration_s"] = round((time.perf_counter_ns() - self._start_ns) / 1e9, 2)
+        # Latency arrays are converted to lists so the result stays JSON-serializable.
+        return {k: v.tolist() if isinstance(v, array.array) else v for k, v in self.metrics.items()}
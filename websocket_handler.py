@@ -1,29 +1,62 @@
 import asyncio
-import json
+import functools
 import logging
 import re
+import struct
 import time
-from collections import deque
+from dataclasses import dataclass
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from .core.asr_adapter import MockASR
 from .core.emotion import infer_emotion, normalize_emotion, strip_leading_emotion_tag
 from .core.llm_adapter import LLMAdapter
-from .core.prethink import build_prethink_injection_block, build_prethink_prompt, sanitize_prethink_result
+from .core.outbound import RawJson
+from .core.prethink import (
+    build_prethink_injection_block,
+    build_prethink_prompt,
+    prethink_result_settled,
+    sanitize_prethink_result,
+)
 from .core.prompt_builder import build_system_prompt
 from .core.session_manager import session_manager
 from .core.state_machine import CallState
 from .core.text_chunker import TextChunker
 from .core.tts_manager import tts_manager
 from .core.vad import VADManager
-from .utils.audio import decode_b64_to_bytes, encode_wav_to_b64, pcm16_to_wav_bytes
+from .utils.audio import (
+    WAV_HEADER_SIZE,
+    PcmRingBuffer,
+    decode_b64_to_bytes,
+    encode_wav_to_b64,
+    parse_wav_header,
+    pcm16_to_wav_bytes,
+)
 
 logger = logging.getLogger("call_me_ws")
 router = APIRouter()
 
 CHUNK_DURATION_MS = 20
 MEANINGFUL_TTS_TEXT_RE = re.compile(r"[A-Za-z0-9\u4e00-\u9fff\u3040-\u30ff\uac00-\ud7a3]")
+# binary_audio 帧: tag(u8) + seq(u32 LE) + sample_rate(u32 LE) + WAV bytes
+TTS_AUDIO_FRAME_TAG = 0x01
+# 流式 TTS 下发节奏：首块攒够 ~20ms 就发（压低首音延迟），之后每次翻倍直到上限
+TTS_FIRST_EMIT_MS = 20
+TTS_MAX_EMIT_BYTES = 65536
+# 启发式表情更新节流：回复每新增这么多字、且距上次至少这么久，才重新扫描整段回复
+EMOTION_UPDATE_MIN_CHARS = 60
+EMOTION_UPDATE_MIN_INTERVAL_S = 0.5
+_TTS_AUDIO_FRAME_HEADER = struct.Struct("<BII")
+# 流式开头可能被拆开的情绪标签: <emo / [emo / 【情绪 / 【emotion (含 <emotion 等)
+_EMOTION_TAG_OPEN_RE = re.compile(r"\s*(<emo|\[emo|【情绪|【emotion)")
+_EMOTION_TAG_CLOSE = {"<emo": ">", "[emo": "]", "【情绪": "】", "【emotion": "】"}
+_HISTORY_ROLE_PREFIX = {"user": "用户: "}
+# 状态帧内容固定，预先序列化
+_STATE_UPDATE_FRAMES = {
+    state: RawJson(orjson.dumps({"type": "state.update", "state": state}))
+    for state in ("thinking", "speaking", "listening", "interrupted")
+}
 
 _PRETHINK_DEFAULTS = {
     "enabled": False,
@@ -65,6 +98,49 @@ def _resolve_prethink_config(plugin_config: dict | None) -> dict:
     }
 
 
+@dataclass(frozen=True)
+class TurnConfig:
+    """process_turn 用到的配置，每个连接解析一次"""
+
+    history_window_messages: int = 12
+    output_sample_rate: int = 24000
+    model_name: str = "replyer"
+    tts_segment_concurrency: int = 1
+
+    @classmethod
+    def from_plugin_config(cls, plugin_config: dict | None) -> "TurnConfig":
+        if not isinstance(plugin_config, dict):
+            return cls()
+        llm_cfg = plugin_config.get("llm", {})
+        if not isinstance(llm_cfg, dict):
+            llm_cfg = {}
+        try:
+            history_window_messages = int(llm_cfg.get("history_window_messages", 12))
+        except Exception:
+            history_window_messages = 12
+
+        output_sample_rate = 24000
+        audio_cfg = plugin_config.get("audio", {})
+        if isinstance(audio_cfg, dict):
+            output_sample_rate = int(audio_cfg.get("sample_rate", 24000))
+        tts_cfg = plugin_config.get("tts", {})
+        if not isinstance(tts_cfg, dict):
+            tts_cfg = {}
+        if str(tts_cfg.get("type", "")).strip() == "cosyvoice_http":
+            output_sample_rate = int(tts_cfg.get("cosyvoice_sample_rate", output_sample_rate))
+        try:
+            tts_segment_concurrency = int(tts_cfg.get("segment_concurrency", 1))
+        except Exception:
+            tts_segment_concurrency = 1
+
+        return cls(
+            history_window_messages=max(2, min(120, history_window_messages)),
+            output_sample_rate=output_sample_rate,
+            model_name=llm_cfg.get("model_name", "replyer"),
+            tts_segment_concurrency=max(1, min(8, tts_segment_concurrency)),
+        )
+
+
 def _resolve_playback_config(plugin_config: dict | None) -> dict:
     audio_cfg = {}
     if isinstance(plugin_config, dict):
@@ -104,39 +180,19 @@ def _sanitize_tts_text(text: str) -> str:
     return cleaned
 
 
-def _is_meaningful_tts_text(text: str) -> bool:
-    return bool(MEANINGFUL_TTS_TEXT_RE.search(text or ""))
-
-
-def _is_wav_bytes(payload: bytes) -> bool:
-    return len(payload) >= 12 and payload[:4] == b"RIFF" and payload[8:12] == b"WAVE"
-
+_EMOTION_TAG_LEADS = frozenset("[<【")
 
-def _extract_wav_sample_rate(payload: bytes) -> int | None:
-    if not _is_wav_bytes(payload) or len(payload) < 28:
-        return None
-    try:
-        sample_rate = int.from_bytes(payload[24:28], byteorder="little", signed=False)
-    except Exception:
-        return None
-    if sample_rate <= 0:
-        return None
-    return sample_rate
 
-
-def _strip_empty_wav_header_prefix(payload: bytes) -> tuple[bytes, bool]:
+@functools.lru_cache(maxsize=2048)
+def _clean_tts_chunk(text: str) -> str:
     """
-    GPT-SoVITS streaming wav can emit a header-only first frame (44 bytes),
-    and transport chunking may concatenate that header with following raw PCM.
-    Strip this synthetic header so trailing bytes can be handled as PCM16.
+    分句器输出（已 strip）的一遍式清洗：去掉泄漏的情绪标签并判定是否可读，
+    不可读时返回空串。只有首字符可能开启标签时才跑标签正则。
+    纯函数，短句/标点片段高度重复，按文本缓存结果。
     """
-    if not _is_wav_bytes(payload) or len(payload) < 44:
-        return payload, False
-    riff_size = int.from_bytes(payload[4:8], byteorder="little", signed=False)
-    data_size = int.from_bytes(payload[40:44], byteorder="little", signed=False)
-    if riff_size == 36 and data_size == 0:
-        return payload[44:], True
-    return payload, False
+    if text and text[0] in _EMOTION_TAG_LEADS:
+        text = _sanitize_tts_text(text)
+    return text if MEANINGFUL_TTS_TEXT_RE.search(text) else ""
 
 
 def _to_playable_wav_chunk(
@@ -150,27 +206,129 @@ def _to_playable_wav_chunk(
     if not chunk_bytes:
         return b"", pcm_carry
 
-    normalized_bytes, stripped_empty_header = _strip_empty_wav_header_prefix(chunk_bytes)
-    if stripped_empty_header:
-        chunk_bytes = normalized_bytes
+    header = parse_wav_header(chunk_bytes)
+    if header is not None:
+        if not header.header_only:
+            return chunk_bytes, b""
+        # GPT-SoVITS streaming wav can emit a header-only first frame (44 bytes),
+        # and transport chunking may concatenate it with following raw PCM.
+        chunk_bytes = chunk_bytes[WAV_HEADER_SIZE:]
         if not chunk_bytes:
             return b"", b""
-    elif _is_wav_bytes(chunk_bytes):
-        return chunk_bytes, b""
 
-    pcm_bytes = (pcm_carry or b"") + chunk_bytes
-    if len(pcm_bytes) < 2:
-        return b"", pcm_bytes
+    return _pcm16_chunk_to_wav(chunk_bytes, sample_rate, channels, pcm_carry)
+
+
+def _pcm16_chunk_to_wav(
+    chunk_bytes: bytes, sample_rate: int, channels: int = 1, pcm_carry: bytes = b""
+) -> tuple[bytes, bytes]:
+    pcm_carry = pcm_carry or b""
+    even_len = (len(pcm_carry) + len(chunk_bytes)) & ~1
+    if not even_len:
+        return b"", pcm_carry + chunk_bytes
+
+    # 只拷贝一次: carry + chunk 的偶数长度部分直接拼进 WAV，奇数尾字节留作下次 carry
+    view = memoryview(chunk_bytes)
+    head = even_len - len(pcm_carry)
+    pcm = b"".join((pcm_carry, view[:head])) if pcm_carry else view[:head]
+    return pcm16_to_wav_bytes(pcm, sample_rate=sample_rate, channels=channels), bytes(view[head:])
+
+
+@dataclass
+class WavStreamNormalizer:
+    """
+    Per-synthesis stream state. The WAV header (sample rate, header-only first
+    frame) is resolved once on the first non-empty chunk; later raw PCM16 is
+    wrapped straight from the caller's buffer.
+    """
+
+    sample_rate: int
+    channels: int = 1
+    header_resolved: bool = False
+    pcm_carry: bytes = b""
+    # 首块就是完整 WAV 的流，后续块仍可能各自带头，需要继续透传
+    wav_framed: bool = False
+
+    def feed(self, buf: bytearray) -> bytes:
+        """Consume buf into one playable WAV chunk; an odd trailing PCM byte is left in buf."""
+        if not buf:
+            return b""
+        if not self.header_resolved:
+            self.header_resolved = True
+            header = parse_wav_header(buf)
+            if header is not None:
+                if header.sample_rate is not None:
+                    self.sample_rate = header.sample_rate
+                if header.header_only:
+                    del buf[:WAV_HEADER_SIZE]
+                else:
+                    # 首块即完整 WAV：头已解析过，直接透传，不再交给 _to_playable_wav_chunk 重复解析
+                    self.wav_framed = True
+                    chunk = bytes(buf)
+                    buf.clear()
+                    return chunk
+        if self.wav_framed:
+            chunk = bytes(buf)
+            buf.clear()
+            wav_chunk, self.pcm_carry = _to_playable_wav_chunk(
+                chunk, sample_rate=self.sample_rate, channels=self.channels, pcm_carry=self.pcm_carry
+            )
+            return wav_chunk
+
+        # 裸 PCM16: 直接从缓冲区取偶数长度部分封装，奇数尾字节留在 buf 中作为 carry
+        n = len(buf) & ~1
+        if not n:
+            return b""
+        with memoryview(buf) as view, view[:n] as pcm:
+            wav_chunk = pcm16_to_wav_bytes(pcm, sample_rate=self.sample_rate, channels=self.channels)
+        del buf[:n]
+        return wav_chunk
 
-    next_carry = b""
-    if len(pcm_bytes) % 2 == 1:
-        next_carry = pcm_bytes[-1:]
-        pcm_bytes = pcm_bytes[:-1]
 
-    if not pcm_bytes:
-        return b"", next_carry
+class _Ms(float):
+    """Perf 日志里的毫秒值：按 %s 输出时才格式化为一位小数"""
 
-    return pcm16_to_wav_bytes(pcm_bytes, sample_rate=sample_rate, channels=channels), next_carry
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"{self:.1f}"
+
+
+def _tts_audio_chunk_json(seq_id: int, is_final: bool, b64_audio: bytes, sample_rate: int) -> RawJson:
+    """
+    tts.audio_chunk 信封形状固定，直接拼接 JSON 字节；base64 本身是合法 JSON 字符串内容，
+    省去 decode + orjson 再编码大块 payload。字段顺序与原 dict 一致。
+    """
+    return RawJson(
+        b"".join(
+            (
+                b'{"type":"tts.audio_chunk","seq":',
+                str(seq_id).encode(),
+                b',"is_final":true,"data":{"chunk":"' if is_final else b',"is_final":false,"data":{"chunk":"',
+                b64_audio,
+                b'","sample_rate":',
+                str(sample_rate).encode(),
+                b"}}",
+            )
+        )
+    )
+
+
+def _tts_audio_json(seq_id: int, text: str, wav_bytes: bytes, is_final: bool) -> RawJson:
+    """整段 tts.audio 消息：base64 与 JSON 信封一次拼好，可整体放到线程里执行"""
+    return RawJson(
+        b"".join(
+            (
+                b'{"type":"tts.audio","seq":',
+                str(seq_id).encode(),
+                b',"text":',
+                orjson.dumps(text),
+                b',"audio":"',
+                encode_wav_to_b64(wav_bytes),
+                b'","is_final":true}' if is_final else b'","is_final":false}',
+            )
+        )
+    )
 
 
 def _resolve_leading_emotion_prefix(prefix: str) -> tuple[str, str | None, str]:
@@ -188,45 +346,46 @@ def _resolve_leading_emotion_prefix(prefix: str) -> tuple[str, str | None, str]:
     if tag_emotion:
         return "resolved", tag_emotion, cleaned
 
-    stripped = prefix.lstrip()
-    if not stripped:
+    if prefix.isspace():
         return "need_more", None, ""
 
     # Wait for split chunks when model starts with a tag such as:
     # <emo:happy> / [emotion:happy] / 【情绪:开心】
-    if (stripped.startswith("<emo") or stripped.startswith("<emotion")) and ">" not in stripped:
-        return "need_more", None, ""
-    if (stripped.startswith("[emo") or stripped.startswith("[emotion")) and "]" not in stripped:
-        return "need_more", None, ""
-    if (stripped.startswith("【情绪") or stripped.startswith("【emotion")) and "】" not in stripped:
+    m = _EMOTION_TAG_OPEN_RE.match(prefix)
+    if m and _EMOTION_TAG_CLOSE[m.group(1)] not in prefix:
         return "need_more", None, ""
 
     return "no_tag", None, prefix
 
 
-async def _run_process_turn_locked(session, llm, text, plugin_config, timing_ctx):
+async def _run_process_turn_locked(session, llm, text, plugin_config, timing_ctx, turn_cfg):
     # Ensure one process_turn pipeline is active per session.
     async with session.process_lock:
         if session.is_cancelled:
             return
-        await process_turn(session, llm, None, text, plugin_config, timing_ctx)
+        await process_turn(session, llm, None, text, plugin_config, timing_ctx, turn_cfg)
 
 
-def _spawn_turn_task(session, llm, text, plugin_config, timing_ctx):
-    task = asyncio.create_task(
-        _run_process_turn_locked(session, llm, text, plugin_config, timing_ctx),
-        name=f"call_me_turn_{session.session_id}_{timing_ctx.get('turn_id', 'n/a')}",
+def _submit_turn(session, llm, text, plugin_config, timing_ctx, turn_cfg):
+    return session.submit_turn(
+        functools.partial(_run_process_turn_locked, session, llm, text, plugin_config, timing_ctx, turn_cfg)
     )
-    session.track_task(task)
-    return task
 
 
-async def _run_prethink_job(session, llm, model_name: str, prompt: str, timeout_ms: int, max_output_chars: int, job_id: int, source_turn_id: int):
+async def _run_prethink_job(
+    session, llm, model_name: str, recent_history: list[dict], timeout_ms: int, max_output_chars: int, job_id: int, source_turn_id: int
+):
     started = time.perf_counter()
+    # prompt 在 job 内拼装，不占用轮次结束时的事件循环
+    prompt = build_prethink_prompt(recent_history)
     local_cancel = asyncio.Event()
     logger.info(
-        f"[Prethink] prethink_start session={session.session_id} job={job_id} "
-        f"source_turn={source_turn_id} model={model_name} timeout_ms={timeout_ms}"
+        "[Prethink] prethink_start session=%s job=%s source_turn=%s model=%s timeout_ms=%s",
+        session.session_id,
+        job_id,
+        source_turn_id,
+        model_name,
+        timeout_ms,
     )
 
     async def _collect_stream() -> str:
@@ -239,38 +398,40 @@ async def _run_prethink_job(session, llm, model_name: str, prompt: str, timeout_
             total_len += len(chunk)
             if total_len >= max_output_chars * 3:
                 break
+            # 完整行已足够得出最终 hint 时提前结束，少等/少耗 token
+            if "\n" in chunk and prethink_result_settled("".join(chunks), max_output_chars):
+                break
         return "".join(chunks)
 
     try:
         raw = await asyncio.wait_for(_collect_stream(), timeout=timeout_ms / 1000.0)
         hint = sanitize_prethink_result(raw, max_chars=max_output_chars)
         if not hint:
-            logger.info(
-                f"[Prethink] prethink_miss session={session.session_id} job={job_id} reason=empty"
-            )
+            logger.info("[Prethink] prethink_miss session=%s job=%s reason=empty", session.session_id, job_id)
             return
 
         if session.store_prethink_hint(job_id, hint, source_turn_id):
             latency_ms = (time.perf_counter() - started) * 1000.0
             logger.info(
-                f"[Prethink] prethink_ready session={session.session_id} job={job_id} "
-                f"latency_ms={latency_ms:.1f} chars={len(hint)}"
+                "[Prethink] prethink_ready session=%s job=%s latency_ms=%.1f chars=%d",
+                session.session_id,
+                job_id,
+                latency_ms,
+                len(hint),
             )
         else:
-            logger.info(
-                f"[Prethink] prethink_miss session={session.session_id} job={job_id} reason=stale"
-            )
+            logger.info("[Prethink] prethink_miss session=%s job=%s reason=stale", session.session_id, job_id)
     except asyncio.TimeoutError:
-        logger.info(f"[Prethink] prethink_timeout session={session.session_id} job={job_id}")
+        logger.info("[Prethink] prethink_timeout session=%s job=%s", session.session_id, job_id)
     except asyncio.CancelledError:
         local_cancel.set()
-        logger.info(f"[Prethink] prethink_cancelled session={session.session_id} job={job_id}")
+        logger.info("[Prethink] prethink_cancelled session=%s job=%s", session.session_id, job_id)
         raise
     except Exception as e:
-        logger.warning(f"[Prethink] prethink_error session={session.session_id} job={job_id}: {e}")
+        logger.warning("[Prethink] prethink_error session=%s job=%s: %s", session.session_id, job_id, e)
 
 
-def _spawn_prethink_task(session, llm, plugin_config, source_turn_id: int):
+def _submit_prethink_job(session, llm, plugin_config, source_turn_id: int):
     prethink_cfg = _resolve_prethink_config(plugin_config)
     if not prethink_cfg["enabled"]:
         return None
@@ -281,34 +442,28 @@ def _spawn_prethink_task(session, llm, plugin_config, source_turn_id: int):
 
     last_user_text = _pick_last_user_text(chat_history)
     if len(last_user_text) < prethink_cfg["min_user_text_chars"]:
-        logger.info(
-            f"[Prethink] prethink_miss session={session.session_id} reason=user_text_too_short"
-        )
+        logger.info("[Prethink] prethink_miss session=%s reason=user_text_too_short", session.session_id)
         return None
 
-    recent_history = chat_history[-prethink_cfg["max_history_messages"] :]
-    prompt = build_prethink_prompt(recent_history)
-
     llm_cfg = plugin_config.get("llm", {}) if isinstance(plugin_config, dict) else {}
     fallback_model_name = llm_cfg.get("model_name", "replyer") if isinstance(llm_cfg, dict) else "replyer"
     model_name = prethink_cfg["model_name"] or fallback_model_name
 
     job_id = session.create_prethink_job()
-    task = asyncio.create_task(
-        _run_prethink_job(
-            session=session,
-            llm=llm,
-            model_name=model_name,
-            prompt=prompt,
-            timeout_ms=prethink_cfg["timeout_ms"],
-            max_output_chars=prethink_cfg["max_output_chars"],
-            job_id=job_id,
-            source_turn_id=int(source_turn_id or 0),
-        ),
-        name=f"call_me_prethink_{session.session_id}_{job_id}",
+    job = functools.partial(
+        _run_prethink_job,
+        session=session,
+        llm=llm,
+        model_name=model_name,
+        # 切片即快照：job 延后执行时历史可能已追加新消息
+        recent_history=chat_history[-prethink_cfg["max_history_messages"] :],
+        timeout_ms=prethink_cfg["timeout_ms"],
+        max_output_chars=prethink_cfg["max_output_chars"],
+        job_id=job_id,
+        source_turn_id=int(source_turn_id or 0),
     )
-    session.set_prethink_task(task, job_id=job_id)
-    return task
+    session.submit_prethink(job, job_id=job_id)
+    return job_id
 
 
 @router.websocket("/ws/call")
@@ -368,12 +523,13 @@ async def websocket_endpoint(websocket: WebSocket):
     # WebRTC VAD can start late for weak first syllables, so default is longer.
     pre_roll_ms = int(vad_config.get("pre_roll_ms", max(int(vad_config.get("speech_start_ms", 150)) + 120, 420)))
     pre_roll_frames = max(1, min(80, (pre_roll_ms // CHUNK_DURATION_MS) + 1))
-    pre_roll_audio = deque(maxlen=pre_roll_frames)
+    pre_roll_audio = PcmRingBuffer(pre_roll_frames * vad.frame_bytes(CHUNK_DURATION_MS))
     logger.info(f"[WS] VAD preroll configured: pre_roll_ms={pre_roll_ms} frames={pre_roll_frames}")
 
     llm = LLMAdapter()
     await asr.start_stream()
     playback_cfg = _resolve_playback_config(plugin_config if isinstance(plugin_config, dict) else {})
+    turn_cfg = TurnConfig.from_plugin_config(plugin_config)
 
     try:
         session = await session_manager.create_session(websocket)
@@ -386,17 +542,17 @@ async def websocket_endpoint(websocket: WebSocket):
             session.create_prethink_job()
 
             # New turn: cancel previous tasks and wait briefly for cleanup.
-            if session.state.current in (CallState.THINKING, CallState.SPEAKING) or session.has_tracked_tasks():
+            if session.state.current in (CallState.THINKING, CallState.SPEAKING) or session.turn_busy():
                 session.cancel_current_tasks()
-                await session.wait_tracked_tasks(timeout=0.5)
+                await session.wait_turn_idle(timeout=0.5)
             session.create_cancel_token()
 
             session.state.transition_to(CallState.THINKING)
-            await websocket.send_json({"type": "state.update", "state": "thinking"})
+            await session.outbound.send(_STATE_UPDATE_FRAMES["thinking"], flush=True)
 
             session.append_history("user", user_text)
 
-            turn_id = getattr(session, "_turn_seq", 0) + 1
+            turn_id = session._turn_seq + 1
             session._turn_seq = turn_id
             prethink_hint, prethink_age_ms, prethink_source_turn_id = session.consume_prethink_hint()
             prethink_hit = 1 if prethink_hint else 0
@@ -412,37 +568,58 @@ async def websocket_endpoint(websocket: WebSocket):
             }
             if asr_final_ms is not None:
                 logger.info(
-                    f"[Perf][{session.session_id}][turn={turn_id}] "
-                    f"asr_final_ms={asr_final_ms:.1f} text_len={len(user_text)}"
+                    "[Perf][%s][turn=%s] asr_final_ms=%.1f text_len=%d",
+                    session.session_id,
+                    turn_id,
+                    asr_final_ms,
+                    len(user_text),
                 )
             logger.info(
-                f"[Prethink] {'prethink_hit' if prethink_hit else 'prethink_miss'} "
-                f"session={session.session_id} turn={turn_id} "
-                f"age_ms={prethink_age_ms if prethink_age_ms is not None else 'n/a'} "
-                f"source_turn={prethink_source_turn_id if prethink_source_turn_id is not None else 'n/a'}"
+                "[Prethink] %s session=%s turn=%s age_ms=%s source_turn=%s",
+                "prethink_hit" if prethink_hit else "prethink_miss",
+                session.session_id,
+                turn_id,
+                prethink_age_ms if prethink_age_ms is not None else "n/a",
+                prethink_source_turn_id if prethink_source_turn_id is not None else "n/a",
             )
-            _spawn_turn_task(session, llm, user_text, plugin_config, timing_ctx)
+            _submit_turn(session, llm, user_text, plugin_config, timing_ctx, turn_cfg)
 
         while True:
             # 协议定义:
             # { "type": "client.hello" | "input.audio_chunk" | "input.text" | ... , "data": ... }
-            message = await websocket.receive_json()
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            audio_frame = frame.get("bytes")
+            if audio_frame is not None:
+                # 二进制帧 = 一块 PCM16，等价于 input.audio_chunk（免 base64）
+                message = {"type": "input.audio_chunk"}
+            else:
+                message = orjson.loads(frame.get("text") or "")
             msg_type = message.get("type")
             data = message.get("data", {})
 
             if msg_type == "client.hello":
-                await websocket.send_json({"type": "server.hello", "session_id": session.session_id})
-                await websocket.send_json({"type": "client.config", "data": {"playback": playback_cfg}})
-                await websocket.send_json({"type": "avatar.state", "emotion": "neutral", "source": "system"})
+                capabilities = data.get("capabilities") if isinstance(data, dict) else None
+                if isinstance(capabilities, list):
+                    session.outbound.batching = "batch" in capabilities
+                    session.binary_audio = "binary_audio" in capabilities
+                await session.outbound.send({"type": "server.hello", "session_id": session.session_id})
+                await session.outbound.send({"type": "client.config", "data": {"playback": playback_cfg}})
+                await session.outbound.send({"type": "avatar.state", "emotion": "neutral", "source": "system"}, flush=True)
                 continue
 
             if msg_type == "input.audio_chunk":
                 try:
-                    b64_audio = data.get("chunk", "")
-                    if not b64_audio:
+                    if audio_frame is not None:
+                        audio_bytes = audio_frame
+                    else:
+                        b64_audio = data.get("chunk", "")
+                        if not b64_audio:
+                            continue
+                        audio_bytes = decode_b64_to_bytes(b64_audio)
+                    if not audio_bytes:
                         continue
-
-                    audio_bytes = decode_b64_to_bytes(b64_audio)
                     pre_roll_audio.append(audio_bytes)
 
                     # 1) VAD on current chunk
@@ -454,9 +631,9 @@ async def websocket_endpoint(websocket: WebSocket):
                         await asr.start_stream()
                         session._last_partial_text = ""
 
-                        # Feed preroll to ASR to avoid clipping speech head.
-                        for frame in pre_roll_audio:
-                            await asr.push_audio_chunk(frame)
+                        # Feed preroll to ASR to avoid clipping speech head (one push; adapters accept any PCM length).
+                        if pre_roll_audio:
+                            await asr.push_audio_chunk(pre_roll_audio.getvalue())
                         pre_roll_audio.clear()
 
                         # Barge-in if assistant is speaking.
@@ -464,10 +641,10 @@ async def websocket_endpoint(websocket: WebSocket):
                             session.cancel_current_tasks()
                             session.state.transition_to(CallState.INTERRUPTED)
                             try:
-                                await websocket.send_json({"type": "state.update", "state": "interrupted"})
+                                await session.outbound.send(_STATE_UPDATE_FRAMES["interrupted"], flush=True)
                             except Exception:
                                 pass
-                            await session.wait_tracked_tasks(timeout=0.3)
+                            await session.wait_turn_idle(timeout=0.3)
                     elif vad.is_speech_active:
                         # During active speech, feed current chunk.
                         await asr.push_audio_chunk(audio_bytes)
@@ -475,13 +652,11 @@ async def websocket_endpoint(websocket: WebSocket):
                     # 2) Partial ASR feedback (streaming ASR only)
                     if vad.is_speech_active:
                         partial_text = await asr.get_partial()
-                        if partial_text:
-                            last_text = getattr(session, "_last_partial_text", "")
-                            if partial_text != last_text:
-                                await websocket.send_json(
-                                    {"type": "input.text_update", "text": partial_text, "is_final": False}
-                                )
-                                session._last_partial_text = partial_text
+                        if partial_text and partial_text != session._last_partial_text:
+                            await session.outbound.send(
+                                {"type": "input.text_update", "text": partial_text, "is_final": False}
+                            )
+                            session._last_partial_text = partial_text
 
                     # 3) End-of-utterance -> ASR final -> schedule LLM/TTS
                     if event == "end":
@@ -501,7 +676,7 @@ async def websocket_endpoint(websocket: WebSocket):
                             logger.warning("[WS] ASR recognized nothing or failed")
                             continue
 
-                        await websocket.send_json({"type": "input.text_update", "text": final_text, "is_final": True})
+                        await session.outbound.send({"type": "input.text_update", "text": final_text, "is_final": True})
                         session._last_partial_text = ""
                         await schedule_turn(final_text, "audio", asr_final_ms)
                 except Exception as e:
@@ -519,18 +694,18 @@ async def websocket_endpoint(websocket: WebSocket):
                 session.cancel_current_tasks()
                 session.state.transition_to(CallState.INTERRUPTED)
                 try:
-                    await websocket.send_json({"type": "state.update", "state": "interrupted"})
+                    await session.outbound.send(_STATE_UPDATE_FRAMES["interrupted"], flush=True)
                 except Exception:
                     pass
-                await session.wait_tracked_tasks(timeout=0.3)
+                await session.wait_turn_idle(timeout=0.3)
                 continue
 
-            logger.debug(f"[WS] Unknown msg type: {msg_type}")
+            logger.debug("[WS] Unknown msg type: %s", msg_type)
 
     except WebSocketDisconnect:
         if session:
             logger.info(f"[WS] Disconnected: {session.session_id}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.warning(f"[WS] Received non-JSON frame, closing: {e}")
         try:
             await websocket.close(code=1003)
@@ -549,69 +724,60 @@ async def websocket_endpoint(websocket: WebSocket):
             pass
         if session:
             session.cancel_current_tasks()
-            await session.wait_tracked_tasks(timeout=0.5)
+            await session.wait_turn_idle(timeout=0.5)
+            await session.close_workers()
+            await session.outbound.close()
             await session_manager.remove_session(session.session_id)
 
 
-async def process_turn(session, llm, chunker, text, plugin_config=None, timing_ctx=None):
+async def process_turn(session, llm, chunker, text, plugin_config=None, timing_ctx=None, turn_cfg=None):
     """
     处理一轮对话：LLM -> Chunker -> TTS -> Send Audio
     """
-    logger.info(f"[ProcessTurn] Start processing text: {text[:20]}...")
+    logger.info("[ProcessTurn] Start processing text: %s...", text[:20])
     session.state.transition_to(CallState.THINKING)
+    if turn_cfg is None:
+        turn_cfg = TurnConfig.from_plugin_config(plugin_config)
 
     system_prompt = build_system_prompt()
-    llm_cfg = plugin_config.get("llm", {}) if isinstance(plugin_config, dict) else {}
-    history_window_messages = 12
-    if isinstance(llm_cfg, dict):
-        try:
-            history_window_messages = int(llm_cfg.get("history_window_messages", 12))
-        except Exception:
-            history_window_messages = 12
-    history_window_messages = max(2, min(120, history_window_messages))
-    recent_history = session.chat_history[-history_window_messages:]
-    prethink_hint = str((timing_ctx or {}).get("prethink_hint", "") or "").strip()
+    recent_history = session.chat_history[-turn_cfg.history_window_messages :]
+    timing_ctx = timing_ctx or {}
+    prethink_hint = str(timing_ctx.get("prethink_hint", "") or "").strip()
 
     # 构造 Full Prompt
-    full_prompt = f"{system_prompt}\n\n"
+    prompt_parts = [system_prompt, "\n\n"]
     if prethink_hint:
         injection_block = build_prethink_injection_block(prethink_hint)
         if injection_block:
-            full_prompt += f"{injection_block}\n\n"
+            prompt_parts += (injection_block, "\n\n")
     for msg in recent_history:
-        role = "用户" if msg["role"] == "user" else "MaiBot"
-        full_prompt += f"{role}: {msg['content']}\n"
+        prompt_parts.append(_HISTORY_ROLE_PREFIX.get(msg["role"], "MaiBot: "))
+        prompt_parts.append(str(msg["content"]))
+        prompt_parts.append("\n")
 
-    full_prompt += "MaiBot: "
+    prompt_parts.append("MaiBot: ")
+    full_prompt = "".join(prompt_parts)
 
-    full_response_text = ""
+    # 回复文本按片段累积，仅在表情判定/写入历史时拼接
+    response_parts: list[str] = []
+    response_len = 0
     turn_chunker = TextChunker()
-    output_sample_rate = 24000
-    if isinstance(plugin_config, dict):
-        audio_cfg = plugin_config.get("audio", {})
-        if isinstance(audio_cfg, dict):
-            output_sample_rate = int(audio_cfg.get("sample_rate", 24000))
-        tts_cfg = plugin_config.get("tts", {})
-        if isinstance(tts_cfg, dict) and str(tts_cfg.get("type", "")).strip() == "cosyvoice_http":
-            output_sample_rate = int(tts_cfg.get("cosyvoice_sample_rate", output_sample_rate))
+    output_sample_rate = turn_cfg.output_sample_rate
+    model_config_name = turn_cfg.model_name
 
-    model_config_name = "replyer"
-    if isinstance(llm_cfg, dict):
-        model_config_name = llm_cfg.get("model_name", "replyer")
-
-    logger.info(f"[ProcessTurn] Calling LLM generate_stream with model_name='{model_config_name}'...")
+    logger.info("[ProcessTurn] Calling LLM generate_stream with model_name='%s'...", model_config_name)
     try:
-        turn_id = (timing_ctx or {}).get("turn_id", "n/a")
+        turn_id = timing_ctx.get("turn_id", "n/a")
         try:
             numeric_turn_id = int(turn_id)
         except Exception:
             numeric_turn_id = 0
-        turn_source = (timing_ctx or {}).get("source", "unknown")
-        turn_start_at = float((timing_ctx or {}).get("turn_start_at", time.perf_counter()))
-        asr_final_ms = (timing_ctx or {}).get("asr_final_ms")
-        prethink_hit = int((timing_ctx or {}).get("prethink_hit", 1 if prethink_hint else 0))
-        prethink_age_ms = (timing_ctx or {}).get("prethink_age_ms")
-        prethink_source_turn_id = (timing_ctx or {}).get("prethink_source_turn_id")
+        turn_source = timing_ctx.get("source", "unknown")
+        turn_start_at = float(timing_ctx.get("turn_start_at", time.perf_counter()))
+        asr_final_ms = timing_ctx.get("asr_final_ms")
+        prethink_hit = int(timing_ctx.get("prethink_hit", 1 if prethink_hint else 0))
+        prethink_age_ms = timing_ctx.get("prethink_age_ms")
+        prethink_source_turn_id = timing_ctx.get("prethink_source_turn_id")
         llm_start_at = time.perf_counter()
         first_llm_token_at = None
         first_tts_request_at = None
@@ -622,6 +788,8 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
         tts_queue: asyncio.Queue = asyncio.Queue(maxsize=32)
         first_response_emotion: str | None = None
         current_response_emotion: str | None = None
+        next_emotion_update_len = EMOTION_UPDATE_MIN_CHARS
+        next_emotion_update_at = 0.0
         pending_leading_prefix = ""
         awaiting_leading_emotion = True
         leading_prefix_chunks = 0
@@ -630,7 +798,7 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
             if session.state.current != CallState.SPEAKING:
                 session.state.transition_to(CallState.SPEAKING)
                 try:
-                    await session.websocket.send_json({"type": "state.update", "state": "speaking"})
+                    await session.outbound.send(_STATE_UPDATE_FRAMES["speaking"], flush=True)
                 except Exception:
                     pass
 
@@ -641,44 +809,47 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
                 return
             current_response_emotion = emotion
             try:
-                await session.websocket.send_json(
+                await session.outbound.send(
                     {"type": "avatar.state", "emotion": emotion, "source": source, "turn_id": turn_id}
                 )
             except Exception:
                 pass
 
-        async def synthesize_and_send(seq_id: int, chunk_text: str, is_final: bool):
+        async def synthesize_and_send(seq_id: int, chunk_text: str, is_final: bool, audio_stream=None):
             nonlocal first_tts_request_at, first_tts_audio_at, tts_audio_chunks_sent, tts_segment_count
-            chunk_text = _sanitize_tts_text(chunk_text)
-            if not _is_meaningful_tts_text(chunk_text):
-                logger.debug(f"[ProcessTurn] Skip non-meaningful TTS chunk: seq={seq_id}")
-                return
-
-            logger.debug(f"[ProcessTurn] Synthesizing chunk {seq_id}: {chunk_text[:20]}...")
+            # chunk_text 已在入队前经 _clean_tts_chunk 清洗过
+            logger.debug("[ProcessTurn] Synthesizing chunk %s: %s...", seq_id, chunk_text[:20])
             tts_segment_count += 1
             if first_tts_request_at is None:
                 first_tts_request_at = time.perf_counter()
+            if audio_stream is None:
+                audio_stream = tts_manager.synthesize_stream(chunk_text, "voice_id")
             sent_stream_audio = False
             sent_stream_text = False
             pending_audio = bytearray()
-            emit_size = 16384
-            pcm_carry = b""
-            stream_sample_rate = output_sample_rate
-            stream_sample_rate_locked = False
+            emit_size = max(2, output_sample_rate * 2 * TTS_FIRST_EMIT_MS // 1000)
+            wav_stream = WavStreamNormalizer(sample_rate=output_sample_rate)
 
             async def send_text_stream_once():
                 nonlocal sent_stream_text
                 if sent_stream_text:
                     return
                 try:
-                    await session.websocket.send_json(
+                    await session.outbound.send(
                         {"type": "tts.text_stream", "seq": seq_id, "data": {"seq": seq_id, "text": chunk_text}}
                     )
                 except Exception:
                     pass
                 sent_stream_text = True
 
-            async for audio_part in tts_manager.synthesize_stream(chunk_text, "voice_id"):
+            async def send_audio_chunk(wav_chunk: bytes, flush: bool = False) -> bool:
+                if session.binary_audio:
+                    frame = _TTS_AUDIO_FRAME_HEADER.pack(TTS_AUDIO_FRAME_TAG, seq_id, wav_stream.sample_rate) + wav_chunk
+                    return await session.outbound.send_binary(frame, flush=flush)
+                frame = _tts_audio_chunk_json(seq_id, is_final, encode_wav_to_b64(wav_chunk), wav_stream.sample_rate)
+                return await session.outbound.send(frame, flush=flush)
+
+            async for audio_part in audio_stream:
                 if session.is_cancelled:
                     break
 
@@ -688,71 +859,42 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
 
                 sent_stream_audio = True
                 await send_speaking_state_once()
-                raw_chunk = bytes(pending_audio)
-                if not stream_sample_rate_locked:
-                    detected_sr = _extract_wav_sample_rate(raw_chunk)
-                    if detected_sr is not None:
-                        stream_sample_rate = detected_sr
-                        stream_sample_rate_locked = True
-                wav_chunk, pcm_carry = _to_playable_wav_chunk(
-                    raw_chunk, sample_rate=stream_sample_rate, channels=1, pcm_carry=pcm_carry
-                )
-                pending_audio.clear()
-                emit_size = 65536
+                wav_chunk = wav_stream.feed(pending_audio)
+                emit_size = min(TTS_MAX_EMIT_BYTES, emit_size * 2)
                 if not wav_chunk:
                     continue
                 await send_text_stream_once()
-                b64_audio = encode_wav_to_b64(wav_chunk)
-                try:
-                    await session.websocket.send_json(
-                        {
-                            "type": "tts.audio_chunk",
-                            "seq": seq_id,
-                            "is_final": is_final,
-                            "data": {"chunk": b64_audio, "sample_rate": stream_sample_rate},
-                        }
-                    )
-                    tts_audio_chunks_sent += 1
-                    if first_tts_audio_at is None:
-                        first_tts_audio_at = time.perf_counter()
-                except Exception as e:
-                    logger.warning(f"[ProcessTurn] Failed to send streaming TTS chunk: {e}")
+                # 上面的 await 期间可能已被打断：不再为作废的音频排队
+                if session.is_cancelled:
+                    return
+                if not await send_audio_chunk(wav_chunk):
+                    logger.warning("[ProcessTurn] Failed to send streaming TTS chunk: outbound closed")
                     return
+                tts_audio_chunks_sent += 1
+                if first_tts_audio_at is None:
+                    first_tts_audio_at = time.perf_counter()
 
             if pending_audio and not session.is_cancelled:
                 sent_stream_audio = True
                 await send_speaking_state_once()
-                raw_chunk = bytes(pending_audio)
-                if not stream_sample_rate_locked:
-                    detected_sr = _extract_wav_sample_rate(raw_chunk)
-                    if detected_sr is not None:
-                        stream_sample_rate = detected_sr
-                        stream_sample_rate_locked = True
-                wav_chunk, pcm_carry = _to_playable_wav_chunk(
-                    raw_chunk, sample_rate=stream_sample_rate, channels=1, pcm_carry=pcm_carry
-                )
-                if not wav_chunk:
-                    return
-                await send_text_stream_once()
-                b64_audio = encode_wav_to_b64(wav_chunk)
-                try:
-                    await session.websocket.send_json(
-                        {
-                            "type": "tts.audio_chunk",
-                            "seq": seq_id,
-                            "is_final": is_final,
-                            "data": {"chunk": b64_audio, "sample_rate": stream_sample_rate},
-                        }
-                    )
+                wav_chunk = wav_stream.feed(pending_audio)
+                if wav_chunk:
+                    await send_text_stream_once()
+                    if session.is_cancelled:
+                        return
+                    if not await send_audio_chunk(wav_chunk, flush=is_final):
+                        logger.warning("[ProcessTurn] Failed to send final streaming TTS chunk: outbound closed")
+                        return
                     tts_audio_chunks_sent += 1
                     if first_tts_audio_at is None:
                         first_tts_audio_at = time.perf_counter()
-                except Exception as e:
-                    logger.warning(f"[ProcessTurn] Failed to send final streaming TTS chunk: {e}")
-                    return
 
-            if pcm_carry:
-                logger.debug(f"[ProcessTurn] Dropping trailing odd PCM byte for seq={seq_id}")
+            # 无论循环内是否已把缓冲区发空（或只剩奇数尾字节），段末都补一条 meta 并结束当前 batch
+            if session.binary_audio and is_final and sent_stream_audio and not session.is_cancelled:
+                await session.outbound.send({"type": "tts.audio_meta", "seq": seq_id, "is_final": True}, flush=True)
+
+            if pending_audio or wav_stream.pcm_carry:
+                logger.debug("[ProcessTurn] Dropping trailing odd PCM byte for seq=%s", seq_id)
 
             if sent_stream_audio or session.is_cancelled:
                 return
@@ -761,35 +903,109 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
                 raise RuntimeError("[TTS] Doubao stream returned no audio; fallback synthesize() is disabled")
 
             wav_bytes = await tts_manager.synthesize(chunk_text, "voice_id")
+            if session.is_cancelled:
+                return
             if wav_bytes:
                 await send_speaking_state_once()
-                b64_wav = encode_wav_to_b64(wav_bytes)
-                try:
-                    await session.websocket.send_json(
-                        {"type": "tts.audio", "seq": seq_id, "text": chunk_text, "audio": b64_wav, "is_final": is_final}
-                    )
+                # 整段音频较大，base64 与消息拼装放到线程里做，避免阻塞事件循环上的其它会话
+                frame = await asyncio.to_thread(_tts_audio_json, seq_id, chunk_text, wav_bytes, is_final)
+                if session.is_cancelled:
+                    return
+                sent = await session.outbound.send(frame, flush=is_final)
+                if sent:
                     tts_audio_chunks_sent += 1
                     if first_tts_audio_at is None:
                         first_tts_audio_at = time.perf_counter()
-                except Exception as e:
-                    logger.warning(f"[ProcessTurn] Failed to send fallback TTS audio: {e}")
+                else:
+                    logger.warning("[ProcessTurn] Failed to send fallback TTS audio: outbound closed")
             else:
-                logger.warning(f"[ProcessTurn] TTS failed for chunk {seq_id}")
+                logger.warning("[ProcessTurn] TTS failed for chunk %s", seq_id)
 
         async def tts_worker():
+            # 出错后继续消费队列直到 None，避免 LLM 生产端卡在已满的 tts_queue 上；错误在结束时再抛出
+            failure: Exception | None = None
             while True:
                 item = await tts_queue.get()
                 if item is None:
                     break
-                seq_id, chunk_text, is_final = item
-                if session.is_cancelled:
+                if failure is not None or session.is_cancelled:
                     continue
-                await synthesize_and_send(seq_id, chunk_text, is_final)
+                seq_id, chunk_text, is_final = item
+                try:
+                    await synthesize_and_send(seq_id, chunk_text, is_final)
+                except Exception as e:
+                    failure = e
+            if failure is not None:
+                raise failure
 
-        worker_task = asyncio.create_task(tts_worker())
+        async def prefetch_stream(chunk_text: str, parts: asyncio.Queue):
+            # 提前合成的分句：音频先缓存在 parts 中，轮到它时再按序下发
+            try:
+                async for audio_part in tts_manager.synthesize_stream(chunk_text, "voice_id"):
+                    parts.put_nowait(audio_part)
+                parts.put_nowait(None)
+            except Exception as e:
+                parts.put_nowait(e)
+
+        async def drain_prefetched(parts: asyncio.Queue):
+            while True:
+                part = await parts.get()
+                if part is None:
+                    return
+                if isinstance(part, Exception):
+                    raise part
+                yield part
+
+        async def tts_pool_worker(concurrency: int):
+            # 分派端最多保持 concurrency 个分句同时合成；发送端按 seq 顺序逐个下发
+            slots = asyncio.Semaphore(concurrency)
+            ordered: asyncio.Queue = asyncio.Queue()
+            producers: list[asyncio.Task] = []
+            failure: Exception | None = None
+
+            async def dispatch():
+                while True:
+                    item = await tts_queue.get()
+                    if item is None:
+                        ordered.put_nowait(None)
+                        return
+                    if failure is not None or session.is_cancelled:
+                        continue
+                    await slots.acquire()
+                    parts: asyncio.Queue = asyncio.Queue()
+                    producers.append(asyncio.create_task(prefetch_stream(item[1], parts)))
+                    ordered.put_nowait((item, parts))
+
+            dispatcher = asyncio.create_task(dispatch())
+            try:
+                while True:
+                    entry = await ordered.get()
+                    if entry is None:
+                        break
+                    (seq_id, chunk_text, is_final), parts = entry
+                    try:
+                        if failure is None and not session.is_cancelled:
+                            await synthesize_and_send(seq_id, chunk_text, is_final, drain_prefetched(parts))
+                    except Exception as e:
+                        failure = e
+                    finally:
+                        slots.release()
+            finally:
+                dispatcher.cancel()
+                for task in producers:
+                    task.cancel()
+                await asyncio.gather(dispatcher, *producers, return_exceptions=True)
+            if failure is not None:
+                raise failure
+
+        if turn_cfg.tts_segment_concurrency > 1:
+            worker_task = asyncio.create_task(tts_pool_worker(turn_cfg.tts_segment_concurrency))
+        else:
+            worker_task = asyncio.create_task(tts_worker())
+        tts_end_queued = False
         try:
             async for partial_text in llm.generate_stream(full_prompt, model_config_name, session._cancel_event):
-                logger.debug(f"[ProcessTurn] Received LLM chunk: {partial_text[:20]}...")
+                logger.debug("[ProcessTurn] Received LLM chunk: %s...", partial_text[:20])
                 if session.is_cancelled:
                     logger.info("[ProcessTurn] Session cancelled during LLM gen.")
                     break
@@ -817,46 +1033,44 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
                         await send_avatar_state(tag_emotion, source="llm_tag")
 
                 if chunk_text:
-                    full_response_text += chunk_text
+                    response_parts.append(chunk_text)
+                    response_len += len(chunk_text)
 
-                if first_response_emotion is None and full_response_text:
+                if first_response_emotion is None and response_len:
                     # 若模型未输出显式标签，回退为文本启发式判定。
-                    first_response_emotion = infer_emotion(full_response_text, default="neutral")
+                    first_response_emotion = infer_emotion("".join(response_parts), default="neutral")
                     await send_avatar_state(first_response_emotion, source="heuristic")
-                elif full_response_text and len(full_response_text) % 60 < len(chunk_text):
+                elif response_len >= next_emotion_update_len and time.perf_counter() >= next_emotion_update_at:
                     # 长回复过程中允许按内容更新表情。
-                    inferred = infer_emotion(full_response_text, default=current_response_emotion or "neutral")
+                    next_emotion_update_len = response_len + EMOTION_UPDATE_MIN_CHARS
+                    next_emotion_update_at = time.perf_counter() + EMOTION_UPDATE_MIN_INTERVAL_S
+                    inferred = infer_emotion("".join(response_parts), default=current_response_emotion or "neutral")
                     await send_avatar_state(inferred, source="heuristic_update")
 
-                for seq_id, chunk_text, is_final in turn_chunker.process(chunk_text):
+                for item in turn_chunker.process_sanitized(chunk_text, _clean_tts_chunk):
                     if session.is_cancelled:
                         break
-                    cleaned = _sanitize_tts_text(chunk_text)
-                    if not _is_meaningful_tts_text(cleaned):
-                        continue
-                    await tts_queue.put((seq_id, cleaned, is_final))
+                    await tts_queue.put(item)
 
-            for seq_id, chunk_text, is_final in turn_chunker.flush():
+            for item in turn_chunker.flush_sanitized(_clean_tts_chunk):
                 if session.is_cancelled:
                     break
-                cleaned = _sanitize_tts_text(chunk_text)
-                if not _is_meaningful_tts_text(cleaned):
-                    continue
-                await tts_queue.put((seq_id, cleaned, is_final))
+                await tts_queue.put(item)
 
             if not session.is_cancelled and current_response_emotion is None:
                 # 没有任何可判定输出时仍回传默认表情，避免前端悬空。
-                fallback = infer_emotion(text or full_response_text, default="neutral")
+                fallback = infer_emotion(text or "".join(response_parts), default="neutral")
                 await send_avatar_state(fallback, source="fallback")
+
+            # 正常结束：排在已入队分句之后放结束标记，队列满时等 worker 消费，不丢分句
+            if not session.is_cancelled:
+                await tts_queue.put(None)
+                tts_end_queued = True
         finally:
-            try:
-                tts_queue.put_nowait(None)
-            except asyncio.QueueFull:
-                while True:
-                    try:
-                        tts_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+            if not tts_end_queued:
+                # 取消/异常：丢弃未合成的分句（队列有界，最多 maxsize 次），立即放结束标记
+                while not tts_queue.empty():
+                    tts_queue.get_nowait()
                 tts_queue.put_nowait(None)
             try:
                 await worker_task
@@ -866,35 +1080,41 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
         if not session.is_cancelled:
             logger.info("[ProcessTurn] Finished, resetting to LISTENING.")
 
-            if full_response_text:
-                session.append_history("assistant", full_response_text)
+            if response_parts:
+                session.append_history("assistant", "".join(response_parts))
 
             session.state.transition_to(CallState.LISTENING)
             try:
-                await session.websocket.send_json({"type": "state.update", "state": "listening"})
+                await session.outbound.send(_STATE_UPDATE_FRAMES["listening"], flush=True)
             except Exception:
                 pass
 
-            turn_end_at = time.perf_counter()
-            asr_str = "n/a" if asr_final_ms is None else f"{asr_final_ms:.1f}"
-            llm_first_ms = -1.0 if first_llm_token_at is None else (first_llm_token_at - llm_start_at) * 1000.0
-            tts_first_req_ms = -1.0 if first_tts_request_at is None else (first_tts_request_at - llm_start_at) * 1000.0
-            tts_first_audio_ms = -1.0 if first_tts_audio_at is None else (first_tts_audio_at - llm_start_at) * 1000.0
-            turn_total_ms = (turn_end_at - turn_start_at) * 1000.0
-            logger.info(
-                f"[Perf][{session.session_id}][turn={turn_id}] "
-                f"source={turn_source} asr_final_ms={asr_str} "
-                f"llm_first_token_ms={llm_first_ms:.1f} "
-                f"tts_first_request_ms={tts_first_req_ms:.1f} "
-                f"tts_first_audio_ms={tts_first_audio_ms:.1f} "
-                f"tts_segments={tts_segment_count} tts_audio_chunks={tts_audio_chunks_sent} "
-                f"prethink_hit={prethink_hit} "
-                f"prethink_age_ms={f'{prethink_age_ms:.1f}' if isinstance(prethink_age_ms, (int, float)) else 'n/a'} "
-                f"prethink_source_turn={prethink_source_turn_id if prethink_source_turn_id is not None else 'n/a'} "
-                f"turn_total_ms={turn_total_ms:.1f}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                # 只做几次减法；格式化交给 logging，在真正有 handler 输出时才发生
+                turn_end_at = time.perf_counter()
+                logger.info(
+                    "[Perf][%s][turn=%s] source=%s asr_final_ms=%s llm_first_token_ms=%.1f "
+                    "tts_first_request_ms=%.1f tts_first_audio_ms=%.1f tts_segments=%d tts_audio_chunks=%d "
+                    "prethink_hit=%s prethink_age_ms=%s prethink_source_turn=%s turn_total_ms=%.1f",
+                    session.session_id,
+                    turn_id,
+                    turn_source,
+                    "n/a" if asr_final_ms is None else _Ms(asr_final_ms),
+                    -1.0 if first_llm_token_at is None else (first_llm_token_at - llm_start_at) * 1000.0,
+                    -1.0 if first_tts_request_at is None else (first_tts_request_at - llm_start_at) * 1000.0,
+                    -1.0 if first_tts_audio_at is None else (first_tts_audio_at - llm_start_at) * 1000.0,
+                    tts_segment_count,
+                    tts_audio_chunks_sent,
+                    prethink_hit,
+                    _Ms(prethink_age_ms) if isinstance(prethink_age_ms, (int, float)) else "n/a",
+                    prethink_source_turn_id if prethink_source_turn_id is not None else "n/a",
+                    (turn_end_at - turn_start_at) * 1000.0,
+                )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[ProcessTurn] TTS chunk clean cache: %s", _clean_tts_chunk.cache_info())
 
-            _spawn_prethink_task(session, llm, plugin_config or {}, source_turn_id=numeric_turn_id)
+            _submit_prethink_job(session, llm, plugin_config or {}, source_turn_id=numeric_turn_id)
 
     except asyncio.CancelledError:
         logger.info("[ProcessTurn] Cancelled")
@@ -902,8 +1122,8 @@ async def process_turn(session, llm, chunker, text, plugin_config=None, timing_c
     except Exception as e:
         logger.error(f"[ProcessTurn] Exception: {e}", exc_info=True)
         try:
-            await session.websocket.send_json({"type": "error", "message": str(e)})
+            await session.outbound.send({"type": "error", "message": str(e)})
             session.state.transition_to(CallState.LISTENING)
-            await session.websocket.send_json({"type": "state.update", "state": "listening"})
+            await session.outbound.send(_STATE_UPDATE_FRAMES["listening"], flush=True)
         except Exception:
             pass